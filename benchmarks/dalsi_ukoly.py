@@ -0,0 +1,97 @@
+"""
+Benchmark výpisu úkolů na řadě (funkce dalsi_ukoly()).
+Postupně zvětšuje tabulku úkolů a pro každou velikost měří dobu
+odezvy dalsi_ukoly(), vypisuje plán dotazu (EXPLAIN) a pro srovnání
+měří původní postup – načtení všech úkolů a seřazení v Pythonu.
+
+Spuštění:
+    python -m benchmarks.dalsi_ukoly --velikosti 100000,1000000,3000000
+"""
+import argparse
+import random
+
+from src import config
+from src.main import DOTAZ_DALSI_UKOLY, dalsi_ukoly
+
+from .spolecne import (
+    dopln_ukoly, mer, percentil, pripojeni_bench, priprav_tabulku,
+    rozloz_velikosti
+)
+
+
+def plan_dotazu(conn, pocet: int) -> dict:
+    """
+    Vrátí řádek EXPLAIN pro dotaz funkce dalsi_ukoly().
+    """
+    cursor = conn.cursor(dictionary=True)
+    cursor.execute("EXPLAIN " + DOTAZ_DALSI_UKOLY, (pocet,))
+    plan = cursor.fetchone()
+    cursor.close()
+    return plan
+
+
+def nacti_a_serad_vse(conn, pocet: int) -> list[tuple]:
+    """
+    Původní postup: načte všechny úkoly a seřadí je v Pythonu.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        f"SELECT id, název, popis, stav, priorita, termin "
+        f"FROM {config.TABLE_TASKS}"
+    )
+    ukoly = [u for u in cursor.fetchall() if u[3] != config.STAV_HOTOVO]
+    cursor.close()
+    ukoly.sort(key=lambda u: (u[4], u[5] is None, u[5] or 0, u[0]))
+    return ukoly[:pocet]
+
+
+def main(argv: list[str] | None = None):
+    """
+    Zpracuje argumenty příkazové řádky a spustí benchmark.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark výpisu úkolů na řadě."
+    )
+    parser.add_argument("--velikosti", default="100000,1000000,3000000",
+                        help="počty řádků tabulky, při kterých se měří")
+    parser.add_argument("--pocet", type=int,
+                        default=config.POCET_DALSICH_UKOLU,
+                        help="počet vrácených úkolů na řadě")
+    parser.add_argument("--opakovani", type=int, default=200,
+                        help="počet měření dalsi_ukoly() pro každou velikost")
+    parser.add_argument("--bez-srovnani", action="store_true",
+                        help="neměřit načtení a seřazení celé tabulky")
+    args = parser.parse_args(argv)
+
+    nahoda = random.Random(42)
+    conn = pripojeni_bench()
+    priprav_tabulku(conn)
+
+    print(
+        f"{'Řádků':>10}{'p50 ms':>9}{'p99 ms':>9}{'Vše ms':>10}  "
+        f"Plán dotazu"
+    )
+    pocet_radku = 0
+    for velikost in rozloz_velikosti(args.velikosti):
+        dopln_ukoly(conn, pocet_radku, velikost, nahoda)
+        pocet_radku = velikost
+
+        doby = mer(lambda: dalsi_ukoly(conn, args.pocet), args.opakovani)
+        srovnani = float("nan")
+        if not args.bez_srovnani:
+            srovnani = mer(lambda: nacti_a_serad_vse(conn, args.pocet), 1)[0]
+        plan = plan_dotazu(conn, args.pocet)
+        print(
+            f"{velikost:>10}{percentil(doby, 50):>9.2f}"
+            f"{percentil(doby, 99):>9.2f}{srovnani:>10.1f}  "
+            f"key={plan['key']}, type={plan['type']}, "
+            f"Extra={plan['Extra']}"
+        )
+        if "filesort" in (plan["Extra"] or ""):
+            print("Varování: dotaz řadí celou množinu (Using filesort).")
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Společné pomocné funkce pro benchmarky Správce úkolů.
+Benchmarky pracují s vlastní databází config.BENCH_DB_NAME,
+kterou plní velkým množstvím řádků. Výpočet percentilů sdílí
+i generátor zátěže (zatez.py).
+"""
+import random
+import time
+from datetime import date, timedelta
+
+import mysql.connector
+
+from src import config
+from src.main import vytvor_tabulku_ukolu
+from src.stitky import vytvor_tabulky_stitku
+from src.zavislosti import vytvor_tabulku_zavislosti
+
+VELIKOST_DAVKY = 10_000
+
+
+def pripojeni_bench():
+    """
+    Připojí se k MySQL serveru a vytvoří benchmarkovou databázi,
+    pokud ještě neexistuje. Vrátí objekt připojení.
+    """
+    conn = mysql.connector.connect(
+        host=config.DB_HOST,
+        user=config.DB_USER,
+        password=config.DB_PASSWORD
+    )
+    cursor = conn.cursor()
+    cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{config.BENCH_DB_NAME}`")
+    cursor.execute(f"USE `{config.BENCH_DB_NAME}`")
+    cursor.close()
+    return conn
+
+
+def priprav_tabulku(conn):
+    """
+    Smaže a znovu vytvoří tabulky úkolů, závislostí a štítků
+    v benchmarkové databázi.
+    """
+    cursor = conn.cursor()
+    cursor.execute(f"DROP TABLE IF EXISTS {config.TABLE_TASK_TAGS}")
+    cursor.execute(f"DROP TABLE IF EXISTS {config.TABLE_TAGS}")
+    cursor.execute(f"DROP TABLE IF EXISTS {config.TABLE_DEPENDENCIES}")
+    cursor.execute(f"DROP TABLE IF EXISTS {config.TABLE_TASKS}")
+    vytvor_tabulku_ukolu(cursor)
+    vytvor_tabulku_zavislosti(cursor)
+    vytvor_tabulky_stitku(cursor)
+    conn.commit()
+    cursor.close()
+
+
+def dopln_ukoly(conn, od: int, do: int, nahoda: random.Random):
+    """
+    Vloží úkoly s pořadovými čísly od..do-1 po dávkách.
+    Přibližně 60 % úkolů je hotových, 30 % nemá termín.
+
+    Args:
+        conn: Připojení k benchmarkové databázi.
+        od (int): Pořadové číslo prvního vkládaného úkolu.
+        do (int): Pořadové číslo za posledním vkládaným úkolem.
+        nahoda (random.Random): Generátor náhodných čísel.
+    """
+    stavy = [config.STAV_HOTOVO, config.STAV_NEZAHAJENO, config.STAV_PROBIHA]
+    priority = list(config.PRIORITY)
+    zacatek_terminu = date.today()
+    cursor = conn.cursor()
+    for zacatek_davky in range(od, do, VELIKOST_DAVKY):
+        radky = []
+        konec_davky = min(zacatek_davky + VELIKOST_DAVKY, do)
+        for cislo in range(zacatek_davky, konec_davky):
+            termin = None
+            if nahoda.random() >= 0.3:
+                posun = timedelta(days=nahoda.randrange(730))
+                termin = zacatek_terminu + posun
+            radky.append((
+                f"bench-{cislo}",
+                "Úkol benchmarku",
+                nahoda.choices(stavy, [60, 25, 15])[0],
+                nahoda.choice(priority),
+                termin,
+            ))
+        cursor.executemany(
+            f"INSERT INTO {config.TABLE_TASKS} "
+            "(název, popis, stav, priorita, termin) "
+            "VALUES (%s, %s, %s, %s, %s)",
+            radky
+        )
+        conn.commit()
+    cursor.close()
+
+
+def mer(funkce, opakovani: int) -> list[float]:
+    """
+    Zavolá funkci opakovaně a vrátí seřazené doby trvání v milisekundách.
+    """
+    doby = []
+    for _ in range(opakovani):
+        zacatek = time.perf_counter()
+        funkce()
+        doby.append((time.perf_counter() - zacatek) * 1000)
+    return sorted(doby)
+
+
+def rozloz_velikosti(velikosti: str) -> list[int]:
+    """
+    Rozloží seznam velikostí tabulky ve tvaru "10000,100000,1000000".
+    """
+    return sorted(int(v) for v in velikosti.split(",") if v.strip())
+
+
+def percentil(serazene: list[float], p: float) -> float | None:
+    """
+    Vrátí p-tý percentil (metoda nejbližšího pořadí) seřazeného seznamu.
+    Pro prázdný seznam vrátí None.
+    """
+    if not serazene:
+        return None
+    poradi = max(1, -(-len(serazene) * p // 100))  # zaokrouhlení nahoru
+    return serazene[int(poradi) - 1]
@@ -0,0 +1,105 @@
+"""
+Benchmark štítků – hromadné označení úkolů a filtry kombinující
+více štítků (AND/OR/NOT) se stavem úkolu.
+
+Spuštění:
+    python -m benchmarks.stitky --radky 1000000 --stitky 20 --hustota 0.1
+"""
+import argparse
+import contextlib
+import io
+import random
+import time
+
+from src import config
+from src.main import filtrovat_ukoly
+from src.stitky import oznacit_ukoly
+
+from .spolecne import (
+    dopln_ukoly, mer, percentil, pripojeni_bench, priprav_tabulku
+)
+
+VELIKOST_DAVKY_STITKU = 50_000
+
+
+def oznac_nahodne(
+    conn, pocet_radku: int, pocet_stitku: int, hustota: float,
+    nahoda: random.Random
+) -> float:
+    """
+    Každému štítku přiřadí náhodný podíl úkolů (hustota) po dávkách.
+    Vrátí počet označení za sekundu.
+    """
+    celkem = 0
+    zacatek = time.perf_counter()
+    for cislo in range(pocet_stitku):
+        ids = [
+            i for i in range(1, pocet_radku + 1) if nahoda.random() < hustota
+        ]
+        for od in range(0, len(ids), VELIKOST_DAVKY_STITKU):
+            with contextlib.redirect_stdout(io.StringIO()):
+                celkem += oznacit_ukoly(
+                    conn, f"stitek-{cislo}",
+                    ids[od:od + VELIKOST_DAVKY_STITKU]
+                ) or 0
+    return celkem / (time.perf_counter() - zacatek)
+
+
+def main(argv: list[str] | None = None):
+    """
+    Zpracuje argumenty příkazové řádky a spustí benchmark.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark štítků úkolů.")
+    parser.add_argument("--radky", type=int, default=1_000_000,
+                        help="počet úkolů v tabulce")
+    parser.add_argument("--stitky", type=int, default=20,
+                        help="počet různých štítků")
+    parser.add_argument("--hustota", type=float, default=0.1,
+                        help="podíl úkolů označených každým štítkem")
+    parser.add_argument("--opakovani", type=int, default=20,
+                        help="počet měření každého filtru")
+    args = parser.parse_args(argv)
+    if args.stitky < 3:
+        parser.error("Benchmark potřebuje alespoň 3 štítky.")
+
+    nahoda = random.Random(42)
+    conn = pripojeni_bench()
+    priprav_tabulku(conn)
+    dopln_ukoly(conn, 0, args.radky, nahoda)
+    rychlost = oznac_nahodne(
+        conn, args.radky, args.stitky, args.hustota, nahoda
+    )
+    print(
+        f"{args.radky} úkolů, {args.stitky} štítků, hustota "
+        f"{args.hustota:g}: hromadné označení {rychlost:,.0f} přiřazení/s\n"
+    )
+
+    scenare = {
+        "AND 2 štítky": {"stitky_vse": ["stitek-0", "stitek-1"]},
+        "OR 3 štítky": {
+            "stitky_nektery": ["stitek-0", "stitek-1", "stitek-2"]
+        },
+        "AND + NOT + stav": {
+            "filtr_stavu": config.STAV_NEZAHAJENO,
+            "stitky_vse": ["stitek-0"],
+            "stitky_bez": ["stitek-1"],
+        },
+        "AND 3, prvních 100": {
+            "stitky_vse": ["stitek-0", "stitek-1", "stitek-2"],
+            "pocet": 100,
+        },
+    }
+    print(f"{'Filtr':<22}{'Úkolů':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for nazev, filtr in scenare.items():
+        pocet = len(filtrovat_ukoly(conn, **filtr))
+        doby = mer(lambda: filtrovat_ukoly(conn, **filtr), args.opakovani)
+        print(
+            f"{nazev:<22}{pocet:>10}{percentil(doby, 50):>10.1f}"
+            f"{percentil(doby, 99):>10.1f}"
+        )
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,439 @@
+"""
+Generátor zátěže pro Správce úkolů.
+Simuluje mnoho souběžných klientů, kteří volají funkce z main.py
+(pridat_ukol, zobrazit_ukoly s filtrem i bez, aktualizovat_ukol
+a odstranit_ukol) v nastaveném poměru a tempu.
+Pro každou operaci vypíše propustnost, latence p50/p95/p99
+a podíl chyb (včetně kolizí unikátního názvu) a uloží souhrn
+do souboru JSON pro porovnání jednotlivých běhů.
+
+Spuštění (výchozí je testovací databáze config.TEST_DB_NAME,
+jinou databázi lze zvolit přepínačem --databaze):
+    python -m benchmarks.zatez --klienti 8 --tempo 200 --doba 30
+"""
+import argparse
+import io
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import mysql.connector
+
+from src import config
+from src.main import (
+    VYSLEDEK_CHYBA, VYSLEDEK_KOLIZE, VYSLEDEK_NENALEZENO, VYSLEDEK_OK,
+    aktualizovat_ukol, odstranit_ukol, posledni_vysledek, pridat_ukol,
+    vytvoreni_databaze, vytvoreni_tabulky, zobrazit_ukoly
+)
+
+from .spolecne import percentil
+
+OPERACE = (
+    "pridat", "zobrazit", "zobrazit_filtr", "aktualizovat", "odstranit"
+)
+VYCHOZI_MIX = (
+    "pridat=40,zobrazit=15,zobrazit_filtr=15,aktualizovat=20,odstranit=10"
+)
+# Počet názvů, o které se při kolizích přetahují všichni klienti
+POCET_SDILENYCH_NAZVU = 20
+# Pod tímto podílem cílového tempa se vypíše varování
+PODIL_DOSAZENEHO_TEMPA = 0.95
+
+
+class _VystupVlakna(io.TextIOBase):
+    """
+    Náhrada sys.stdout, která zahazuje výstup vláken klientů
+    (hlášky funkcí z main.py při každé operaci). Výstup ostatních
+    vláken předává původnímu standardnímu výstupu.
+    """
+
+    def __init__(self, puvodni):
+        self._puvodni = puvodni
+        self._lokalni = threading.local()
+
+    def write(self, text: str) -> int:
+        if getattr(self._lokalni, "ztlumeno", False):
+            return len(text)
+        return self._puvodni.write(text)
+
+    def flush(self):
+        self._puvodni.flush()
+
+    def ztlum(self):
+        """Zahazuje výstup aktuálního vlákna."""
+        self._lokalni.ztlumeno = True
+
+
+def rozloz_mix(mix: str) -> dict[str, float]:
+    """
+    Rozloží poměr operací ve tvaru "pridat=40,zobrazit=20,...".
+
+    Args:
+        mix (str): Váhy operací oddělené čárkou.
+
+    Returns:
+        dict[str, float]: Váha pro každou operaci (součet nemusí být 100).
+
+    Raises:
+        ValueError: Neznámá operace, záporná váha nebo nulový součet.
+    """
+    vahy = {}
+    for polozka in mix.split(","):
+        if not polozka.strip():
+            continue
+        nazev, _, vaha = polozka.partition("=")
+        nazev = nazev.strip()
+        if nazev not in OPERACE:
+            raise ValueError(f"Neznámá operace '{nazev}'.")
+        vahy[nazev] = float(vaha)
+        if vahy[nazev] < 0:
+            raise ValueError(f"Záporná váha operace '{nazev}'.")
+    if sum(vahy.values()) <= 0:
+        raise ValueError("Součet vah operací musí být kladný.")
+    return vahy
+
+
+def _pripojeni(databaze: str):
+    """Vytvoří vlastní připojení pro jednoho klienta."""
+    return mysql.connector.connect(
+        host=config.DB_HOST,
+        user=config.DB_USER,
+        password=config.DB_PASSWORD,
+        database=databaze
+    )
+
+
+def spust_klienta(
+    index: int, nastaveni: dict
+) -> list[tuple[str, str, float, float]]:
+    """
+    Provádí operace jednoho klienta po dobu nastaveni["doba"] sekund.
+
+    Operace se plánují v pevném tempu. Latence se měří od plánovaného
+    začátku operace, ne od skutečného: když klient nestíhá, doba čekání
+    na zpožděný začátek se do latence započítá (jinak by pomalé
+    odpovědi snížily tempo a zkreslily percentily směrem dolů).
+
+    Args:
+        index (int): Pořadové číslo klienta (kvůli unikátním názvům).
+        nastaveni (dict): Parametry běhu (viz spust_zatez()).
+
+    Returns:
+        list[tuple[str, str, float, float]]: Záznamy (operace, výsledek,
+        latence od plánovaného začátku, zpoždění začátku za plánem),
+        časy v sekundách.
+    """
+    if not isinstance(sys.stdout, _VystupVlakna):  # Nový proces
+        sys.stdout = _VystupVlakna(sys.stdout)
+    sys.stdout.ztlum()
+
+    nahoda = random.Random(f"{nastaveni['beh']}-{index}")
+    vahy = nastaveni["mix"]
+    operace_k_vyberu, vahy_k_vyberu = list(vahy), list(vahy.values())
+    interval = nastaveni["klienti"] / nastaveni["tempo"]
+    stavy = [config.STAV_NEZAHAJENO, config.STAV_PROBIHA, config.STAV_HOTOVO]
+
+    zaznamy = []
+    moje_id: list[int] = []
+    pocitadlo = 0
+    db_conn = None
+    try:
+        db_conn = _pripojeni(nastaveni["databaze"])
+    except mysql.connector.Error as err:
+        zaznamy.append(("pripojeni", VYSLEDEK_CHYBA, 0.0, 0.0))
+        print(f"Klient {index}: chyba připojení: {err}", file=sys.stderr)
+        return zaznamy
+
+    try:
+        # Klienti začínají posunutě, aby nezačali všichni současně
+        dalsi_start = time.perf_counter() + interval * nahoda.random()
+        konec = time.perf_counter() + nastaveni["doba"]
+        while True:
+            cekani = dalsi_start - time.perf_counter()
+            if cekani > 0:
+                time.sleep(cekani)
+            if time.perf_counter() >= konec:
+                break
+            planovany_start = dalsi_start
+            dalsi_start += interval
+
+            operace = nahoda.choices(operace_k_vyberu, vahy_k_vyberu)[0]
+            zacatek = time.perf_counter()
+            if operace == "pridat":
+                if nahoda.random() < nastaveni["kolize"]:
+                    # Název ze sady sdílené všemi klienty – souběžná
+                    # přidání téhož úkolu z různých připojení
+                    nazev = (
+                        f"zatez-{nastaveni['beh']}-sdileny-"
+                        f"{nahoda.randrange(POCET_SDILENYCH_NAZVU)}"
+                    )
+                else:
+                    pocitadlo += 1
+                    nazev = f"zatez-{nastaveni['beh']}-{index}-{pocitadlo}"
+                navrat = pridat_ukol(db_conn, nazev, "Úkol generátoru zátěže")
+            elif operace == "zobrazit":
+                navrat = zobrazit_ukoly(db_conn)
+            elif operace == "zobrazit_filtr":
+                navrat = zobrazit_ukoly(db_conn, nahoda.choice(stavy[:2]))
+            elif operace == "aktualizovat":
+                navrat = aktualizovat_ukol(
+                    db_conn,
+                    nahoda.choice(moje_id) if moje_id else 0,
+                    nahoda.choice(stavy[1:])
+                )
+            else:
+                cil = 0
+                if moje_id:
+                    cil = moje_id.pop(nahoda.randrange(len(moje_id)))
+                navrat = odstranit_ukol(db_conn, cil)
+            latence = time.perf_counter() - planovany_start
+            zpozdeni = max(0.0, zacatek - planovany_start)
+
+            vysledek = posledni_vysledek() or VYSLEDEK_CHYBA
+            zaznamy.append((operace, vysledek, latence, zpozdeni))
+            if operace == "pridat" and vysledek == VYSLEDEK_OK:
+                moje_id.append(navrat)
+    finally:
+        if db_conn and db_conn.is_connected():
+            db_conn.close()
+    return zaznamy
+
+
+def souhrn(
+    zaznamy: list[tuple[str, str, float, float]], doba: float
+) -> dict[str, dict]:
+    """
+    Spočítá statistiky pro každou operaci.
+
+    Args:
+        zaznamy (list): Záznamy (operace, výsledek, latence, zpoždění
+            za plánem) s časy v sekundách.
+        doba (float): Skutečná doba běhu v sekundách.
+
+    Returns:
+        dict[str, dict]: Pro každou operaci počty výsledků, propustnost
+        (operace/s), podíl chyb, latence p50/p95/p99 a p99 zpoždění
+        za plánem v milisekundách.
+    """
+    podle_operace: dict[str, list[tuple[str, float, float]]] = {}
+    for operace, vysledek, latence, zpozdeni in zaznamy:
+        podle_operace.setdefault(operace, []).append(
+            (vysledek, latence, zpozdeni)
+        )
+
+    statistiky = {}
+    for operace, data in podle_operace.items():
+        pocty = {
+            vysledek: 0 for vysledek in (
+                VYSLEDEK_OK, VYSLEDEK_KOLIZE,
+                VYSLEDEK_NENALEZENO, VYSLEDEK_CHYBA
+            )
+        }
+        for vysledek, _, _ in data:
+            pocty[vysledek] += 1
+        latence = sorted(l * 1000 for _, l, _ in data)
+        zpozdeni = sorted(z * 1000 for _, _, z in data)
+        neuspechy = pocty[VYSLEDEK_KOLIZE] + pocty[VYSLEDEK_CHYBA]
+        statistiky[operace] = {
+            "pocet": len(data),
+            **pocty,
+            "propustnost_s": round(len(data) / doba, 2) if doba else 0.0,
+            "podil_chyb": round(neuspechy / len(data), 4),
+            "p50_ms": percentil(latence, 50),
+            "p95_ms": percentil(latence, 95),
+            "p99_ms": percentil(latence, 99),
+            "zpozdeni_p99_ms": percentil(zpozdeni, 99),
+        }
+    return statistiky
+
+
+def vypis_souhrn(statistiky: dict[str, dict]):
+    """
+    Vypíše statistiky jako zarovnanou tabulku.
+    """
+    hlavicka = (
+        f"{'Operace':<16}{'Počet':>8}{'Op/s':>9}{'Chyby':>8}"
+        f"{'Kolize':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+        f"{'Zpoždění p99':>14}"
+    )
+    print(hlavicka)
+    print("-" * len(hlavicka))
+    for operace, s in statistiky.items():
+        print(
+            f"{operace:<16}{s['pocet']:>8}{s['propustnost_s']:>9.1f}"
+            f"{s['chyba']:>8}{s['kolize']:>8}{s['p50_ms'] or 0:>9.2f}"
+            f"{s['p95_ms'] or 0:>9.2f}{s['p99_ms'] or 0:>9.2f}"
+            f"{s['zpozdeni_p99_ms'] or 0:>14.2f}"
+        )
+
+
+def spust_zatez(nastaveni: dict) -> dict:
+    """
+    Spustí klienty ve vláknech nebo procesech a vrátí souhrn běhu.
+
+    Args:
+        nastaveni (dict): Parametry běhu – klienti, tempo (operace/s
+            celkem), doba (s), mix (váhy operací), kolize (podíl pokusů
+            o přidání názvu sdíleného všemi klienty), procesy (bool),
+            databaze, beh.
+
+    Returns:
+        dict: Nastavení běhu, skutečná doba, cílové a dosažené tempo
+        a statistiky operací.
+    """
+    puvodni_stdout = sys.stdout
+    if nastaveni["procesy"]:
+        vykonavac = ProcessPoolExecutor
+    else:
+        # Vlákna klientů si výstup ztlumí, ostatní vlákna píší dál
+        vykonavac = ThreadPoolExecutor
+        sys.stdout = _VystupVlakna(puvodni_stdout)
+    zacatek = time.perf_counter()
+    try:
+        with vykonavac(max_workers=nastaveni["klienti"]) as pool:
+            vysledky = pool.map(
+                spust_klienta,
+                range(nastaveni["klienti"]),
+                [nastaveni] * nastaveni["klienti"]
+            )
+            zaznamy = [z for vysledek in vysledky for z in vysledek]
+    finally:
+        sys.stdout = puvodni_stdout
+    doba = time.perf_counter() - zacatek
+
+    return {
+        "nastaveni": nastaveni,
+        "cas_spusteni": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "skutecna_doba_s": round(doba, 3),
+        "cilove_tempo_s": nastaveni["tempo"],
+        "celkova_propustnost_s": round(len(zaznamy) / doba, 2),
+        "operace": souhrn(zaznamy, doba),
+    }
+
+
+def priprav_databazi(databaze: str) -> bool:
+    """
+    Vytvoří databázi pro běh zátěže a v ní tabulky aplikace,
+    pokud ještě neexistují. Vrátí False, pokud se to nepodařilo.
+    """
+    if not vytvoreni_databaze(databaze):
+        return False
+    try:
+        db_conn = _pripojeni(databaze)
+    except mysql.connector.Error as err:
+        print(f"Chyba při připojení k databázi '{databaze}': {err}")
+        return False
+    try:
+        vytvoreni_tabulky(db_conn)
+    finally:
+        db_conn.close()
+    return True
+
+
+def uklid(databaze: str, beh: str):
+    """
+    Odstraní úkoly vytvořené daným během generátoru.
+    """
+    try:
+        db_conn = _pripojeni(databaze)
+    except mysql.connector.Error as err:
+        print(f"Chyba při připojení k databázi: {err}")
+        return
+    cursor = None
+    try:
+        cursor = db_conn.cursor()
+        cursor.execute(
+            f"DELETE FROM {config.TABLE_TASKS} WHERE název LIKE %s",
+            (f"zatez-{beh}-%",)
+        )
+        db_conn.commit()
+        print(f"Odstraněno {cursor.rowcount} úkolů vytvořených během zátěže.")
+    except mysql.connector.Error as err:
+        db_conn.rollback()
+        print(f"Chyba při úklidu úkolů: {err}")
+    finally:
+        if cursor:
+            cursor.close()
+        db_conn.close()
+
+
+def main(argv: list[str] | None = None):
+    """
+    Zpracuje argumenty příkazové řádky a spustí generátor zátěže.
+    """
+    parser = argparse.ArgumentParser(
+        description="Generátor zátěže pro Správce úkolů."
+    )
+    parser.add_argument("--klienti", type=int, default=4,
+                        help="počet souběžných klientů")
+    parser.add_argument("--tempo", type=float, default=50.0,
+                        help="cílový počet operací za sekundu celkem")
+    parser.add_argument("--doba", type=float, default=10.0,
+                        help="doba běhu v sekundách")
+    parser.add_argument("--mix", default=VYCHOZI_MIX,
+                        help="váhy operací, např. 'pridat=50,zobrazit=50'")
+    parser.add_argument("--kolize", type=float, default=0.05,
+                        help="podíl přidání s názvem sdíleným všemi klienty")
+    parser.add_argument("--procesy", action="store_true",
+                        help="spustit klienty v procesech místo vláken")
+    parser.add_argument("--vystup", default="zatez_souhrn.json",
+                        help="soubor JSON se souhrnem běhu")
+    parser.add_argument("--uklid", action="store_true",
+                        help="po běhu odstranit vytvořené úkoly")
+    parser.add_argument("--databaze", default=config.TEST_DB_NAME,
+                        help="databáze pro běh (výchozí je testovací)")
+    args = parser.parse_args(argv)
+
+    try:
+        mix = rozloz_mix(args.mix)
+    except ValueError as err:
+        parser.error(str(err))
+    if args.klienti < 1 or args.tempo <= 0 or args.doba <= 0:
+        parser.error("Počet klientů, tempo a doba musí být kladné.")
+
+    if not priprav_databazi(args.databaze):
+        sys.exit(1)
+
+    nastaveni = {
+        "klienti": args.klienti,
+        "tempo": args.tempo,
+        "doba": args.doba,
+        "mix": mix,
+        "kolize": args.kolize,
+        "procesy": args.procesy,
+        "databaze": args.databaze,
+        "beh": uuid.uuid4().hex[:8],
+    }
+    print(
+        f"Spouštím zátěž {nastaveni['beh']}: {args.klienti} klientů, "
+        f"{args.tempo:g} op/s, {args.doba:g} s."
+    )
+    vysledek = spust_zatez(nastaveni)
+
+    print(
+        f"\nSkutečná doba: {vysledek['skutecna_doba_s']} s, "
+        f"cílové tempo {vysledek['cilove_tempo_s']:g} op/s, "
+        f"dosažené {vysledek['celkova_propustnost_s']} op/s"
+    )
+    if vysledek["celkova_propustnost_s"] < PODIL_DOSAZENEHO_TEMPA * args.tempo:
+        print(
+            "Cílové tempo nebylo dosaženo – klienti nestíhají, latence "
+            "zahrnují i čekání na zpožděný začátek operací."
+        )
+    print()
+    vypis_souhrn(vysledek["operace"])
+
+    with open(args.vystup, "w", encoding="utf-8") as soubor:
+        json.dump(vysledek, soubor, ensure_ascii=False, indent=2)
+    print(f"\nSouhrn byl uložen do '{args.vystup}'.")
+
+    if args.uklid:
+        uklid(nastaveni["databaze"], nastaveni["beh"])
+
+
+if __name__ == "__main__":
+    main()
@@ -8,12 +8,38 @@ STAV_NEZAHAJENO = "Nezahájeno"
 STAV_PROBIHA = "Probíhá"
 STAV_HOTOVO = "Hotovo"
 
+# Priority úkolů (nižší číslo = vyšší priorita)
+PRIORITA_VYSOKA = 1
+PRIORITA_STREDNI = 2
+PRIORITA_NIZKA = 3
+PRIORITY = {
+    PRIORITA_VYSOKA: "Vysoká",
+    PRIORITA_STREDNI: "Střední",
+    PRIORITA_NIZKA: "Nízká",
+}
+# Výchozí počet úkolů ve výpisu "další na řadě"
+POCET_DALSICH_UKOLU = 10
+
 # Konfigurace databáze pro hlavní aplikaci
 DB_HOST = "localhost"
 DB_USER = "root"
 DB_PASSWORD = "1111"
 DB_NAME_APP = "task_manager"
 TABLE_TASKS = "ukoly"
+TABLE_DEPENDENCIES = "zavislosti"
+TABLE_TAGS = "stitky"
+TABLE_TASK_TAGS = "ukoly_stitky"
+
+# Repliky pro čtení (read/write splitting)
+# Seznam adres ve tvaru "host" nebo "host:port", např.
+# ["localhost:3307", "localhost:3308"]. Prázdný seznam = vše jde na primár.
+DB_REPLIKY: list[str] = []
+# Po zápisu čte relace jen z replik, které již provedly její transakce
+# (podle GTID). Pokud primár GTID nepoužívá, čte relace po zápisu
+# po tuto dobu (v sekundách) z primáru (read-your-writes).
+DB_OKNO_PO_ZAPISU_S = 5.0
+# Jak dlouho (v sekundách) se nedostupná replika přeskakuje
+DB_PAUZA_REPLIKY_S = 30.0
 
 # Konfigurace databáze pro testy
 # Host, přihlašovací jméno a heslo mohou být stejné,
@@ -21,3 +47,9 @@ TABLE_TASKS = "ukoly"
 TEST_DB_NAME = "task_manager_test"
 # Název testovací tabulky může být stejný, pokud jej řídí testy
 TEST_TABLE_TASKS = "ukoly"
+TEST_TABLE_DEPENDENCIES = "zavislosti"
+TEST_TABLE_TAGS = "stitky"
+TEST_TABLE_TASK_TAGS = "ukoly_stitky"
+
+# Databáze pro benchmarky (plní se miliony řádků, proto zvlášť)
+BENCH_DB_NAME = "task_manager_benchmark"
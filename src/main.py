@@ -14,17 +14,68 @@ Základní funkce:
 - ošetření duplicitních úkolů
 - ošetření prázdného seznamu úkolů
 - ošetření neplatného čísla úkolu při odstraňování
+- priorita a termín úkolu, výpis úkolů, které jsou na řadě
+- závislosti mezi úkoly (viz zavislosti.py)
+- štítky úkolů a filtrování podle nich (viz stitky.py)
+- stránkovaný výpis dlouhých seznamů (viz vystup.py)
+- směrování čtení na repliky a zápisů na primár (viz smerovac.py)
 """
 import sys
+import threading
+from datetime import date
+from itertools import chain
 
 import mysql.connector
+from mysql.connector import errorcode
 
 from . import config
-
-
-def vytvoreni_databaze() -> bool:
+from .smerovac import (
+    SmerovacSpojeni, rozloz_adresu, spojeni_pro_cteni, spojeni_pro_zapis
+)
+from .stitky import (
+    oznacit_ukoly, podminka_stitku, rozloz_stitky, vytvor_tabulky_stitku
+)
+from .vystup import stranky_seznamu, velikost_stranky, vypis_po_strankach
+from .zavislosti import (
+    pred_odstranenim, pri_zmene_stavu, vytvor_tabulku_zavislosti
+)
+
+# Výsledek poslední operace s úkoly (viz posledni_vysledek())
+VYSLEDEK_OK = "ok"
+VYSLEDEK_KOLIZE = "kolize"
+VYSLEDEK_NENALEZENO = "nenalezeno"
+VYSLEDEK_CHYBA = "chyba"
+
+_posledni_operace = threading.local()
+
+# Výchozí hodnota parametru, který se nemá měnit (na rozdíl od None,
+# které u termínu znamená "bez termínu")
+BEZE_ZMENY = object()
+
+# Sloupce výpisu úkolů: (záhlaví, hodnota z řádku, šířka)
+SLOUPCE_UKOLU = [
+    ("ID", lambda ukol: ukol['id'], 7),
+    ("Název", lambda ukol: ukol['název'], 30),
+    ("Stav", lambda ukol: ukol['stav'], 11),
+    ("Priorita", lambda ukol: config.PRIORITY.get(ukol['priorita'], "?"), 8),
+    (
+        "Termín",
+        lambda ukol: f"{ukol['termin']:%d.%m.%Y}" if ukol['termin'] else "",
+        10
+    ),
+    ("Popis", lambda ukol: ukol['popis'], None),
+]
+# Sloupce výpisu úkolů k výběru (aktualizace, odstranění)
+SLOUPCE_VYBERU = [
+    ("ID", lambda ukol: ukol['id'], 7),
+    ("Název", lambda ukol: ukol['název'], 50),
+    ("Aktuální stav", lambda ukol: ukol['stav'], None),
+]
+
+
+def vytvoreni_databaze(nazev: str = config.DB_NAME_APP) -> bool:
     """
-    Vytvoří databázi 'task_manager', pokud ještě neexistuje.
+    Vytvoří databázi (výchozí 'task_manager'), pokud ještě neexistuje.
     Používá pevně dané přihlašovací údaje.
     Vrací True, pokud databáze existuje nebo byla úspěšně vytvořena,
     jinak False.
@@ -38,11 +89,9 @@ def vytvoreni_databaze() -> bool:
         )
 
         cursor = conn.cursor()
-        cursor.execute(
-            f"CREATE DATABASE IF NOT EXISTS `{config.DB_NAME_APP}`"
-        )
+        cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{nazev}`")
         print(
-            f"Databáze '{config.DB_NAME_APP}' je připravena "
+            f"Databáze '{nazev}' je připravena "
             f"(byla vytvořena, nebo již existuje)."
         )
         cursor.close()
@@ -52,7 +101,7 @@ def vytvoreni_databaze() -> bool:
     except mysql.connector.Error as err:
         print(
             f"Chyba při vytváření/ověřování databáze "
-            f"'{config.DB_NAME_APP}': {err}"
+            f"'{nazev}': {err}"
         )
         return False
 
@@ -75,13 +124,142 @@ def pripojeni_db():
         return None
 
 
-def vytvoreni_tabulky():
+def pripojeni_repliky(adresa: str):
+    """
+    Vytvoří připojení k replice databáze na adrese "host[:port]".
+    Vrátí objekt připojení nebo None v případě chyby.
+    """
+    host, port = rozloz_adresu(adresa)
+    try:
+        return mysql.connector.connect(
+            host=host,
+            port=port,
+            user=config.DB_USER,
+            password=config.DB_PASSWORD,
+            database=config.DB_NAME_APP,
+            autocommit=True  # Každé čtení vidí aktuální data repliky
+        )
+    except mysql.connector.Error as err:
+        print(f"Chyba při připojení k replice '{adresa}': {err}")
+        return None
+
+
+def pripojeni_smerovac():
+    """
+    Vytvoří relaci se směrováním čtení na repliky z config.DB_REPLIKY.
+    Bez nakonfigurovaných replik jde veškerý provoz na primár.
+    Replika, která není při spuštění dostupná, se připojí později.
+    Vrátí objekt SmerovacSpojeni nebo None, pokud selže připojení k primáru.
+    """
+    primarni = pripojeni_db()
+    if not primarni:
+        return None
+    adresy = list(config.DB_REPLIKY)
+    repliky = [pripojeni_repliky(adresa) for adresa in adresy]
+    return SmerovacSpojeni(
+        primarni, repliky,
+        pripojit_repliku=lambda index: pripojeni_repliky(adresy[index])
+    )
+
+
+def vytvor_tabulku_ukolu(cursor):
+    """
+    Vytvoří tabulku úkolů pomocí předaného kurzoru.
+
+    Kromě základních sloupců obsahuje prioritu a termín a dva
+    generované sloupce pro řazení: 'aktivni' (úkol není hotový)
+    a 'termin_razeni' (úkoly bez termínu se řadí na konec).
+    Složený index idx_dalsi_ukoly nad nimi umožňuje, aby dotaz
+    ve funkci dalsi_ukoly() přečetl jen prvních N položek indexu
+    bez řazení celé tabulky.
+    Sloupec 'pocet_nesplnenych' a index idx_pripravene slouží
+    pro výpis připravených úkolů (viz zavislosti.py).
+    """
+    status_enum_hodnoty = (
+        f"'{config.STAV_NEZAHAJENO}', '{config.STAV_PROBIHA}', "
+        f"'{config.STAV_HOTOVO}'"
+    )
+    cursor.execute(f"""
+        CREATE TABLE {config.TABLE_TASKS} (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            název VARCHAR(50) NOT NULL UNIQUE,
+            popis TEXT NOT NULL,
+            stav ENUM({status_enum_hodnoty}),
+            datum_vytvoření TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            priorita TINYINT NOT NULL DEFAULT {config.PRIORITA_STREDNI},
+            termin DATE NULL,
+            aktivni TINYINT
+                AS (IF(stav = '{config.STAV_HOTOVO}', 0, 1)) STORED,
+            termin_razeni DATE
+                AS (IFNULL(termin, '9999-12-31')) STORED,
+            pocet_nesplnenych INT NOT NULL DEFAULT 0,
+            INDEX idx_dalsi_ukoly (aktivni, priorita, termin_razeni, id),
+            INDEX idx_pripravene (stav, pocet_nesplnenych, id)
+        )
+    """)
+
+
+def doplneni_sloupcu_razeni(cursor):
+    """
+    Doplní do existující tabulky úkolů sloupce pro prioritu a termín
+    a index idx_dalsi_ukoly, pokud v ní ještě nejsou
+    (tabulky vytvořené starší verzí programu).
+    """
+    cursor.execute(f"SHOW COLUMNS FROM {config.TABLE_TASKS} LIKE 'priorita'")
+    if cursor.fetchone():
+        return
+
+    print("Doplňuji do tabulky sloupce pro prioritu a termín...")
+    cursor.execute(f"""
+        ALTER TABLE {config.TABLE_TASKS}
+            ADD COLUMN priorita TINYINT NOT NULL
+                DEFAULT {config.PRIORITA_STREDNI},
+            ADD COLUMN termin DATE NULL,
+            ADD COLUMN aktivni TINYINT
+                AS (IF(stav = '{config.STAV_HOTOVO}', 0, 1)) STORED,
+            ADD COLUMN termin_razeni DATE
+                AS (IFNULL(termin, '9999-12-31')) STORED,
+            ADD INDEX idx_dalsi_ukoly (aktivni, priorita, termin_razeni, id)
+    """)
+
+
+def doplneni_sloupce_zavislosti(cursor):
+    """
+    Doplní do existující tabulky úkolů počítadlo nesplněných předchůdců
+    a index idx_pripravene, pokud v ní ještě nejsou
+    (tabulky vytvořené starší verzí programu).
+    """
+    cursor.execute(
+        f"SHOW COLUMNS FROM {config.TABLE_TASKS} LIKE 'pocet_nesplnenych'"
+    )
+    if cursor.fetchone():
+        return
+
+    print("Doplňuji do tabulky sloupec pro závislosti úkolů...")
+    cursor.execute(f"""
+        ALTER TABLE {config.TABLE_TASKS}
+            ADD COLUMN pocet_nesplnenych INT NOT NULL DEFAULT 0,
+            ADD INDEX idx_pripravene (stav, pocet_nesplnenych, id)
+    """)
+
+
+def vytvoreni_tabulky(db=None):
     """
     Ověří existenci tabulky 'ukoly' v databázi a pokud neexistuje,
-    vytvoří ji. Pokud tabulka již existuje, zobrazí informaci.
-    Tabulka obsahuje sloupce pro ID, název, popis, stav a čas vytvoření.
+    vytvoří ji. Pokud tabulka již existuje, zobrazí informaci
+    a případně doplní chybějící sloupce pro prioritu, termín
+    a závislosti. Tabulka obsahuje sloupce pro ID, název, popis, stav,
+    čas vytvoření, prioritu a termín. Vytvoří také tabulku závislostí
+    a tabulky štítků.
+
+    Args:
+        db (optional): Připojení k databázi, ve které se mají tabulky
+            vytvořit (zůstane otevřené). Pokud je None, použije se
+            databáze aplikace.
     """
-    db = pripojeni_db()
+    vlastni_pripojeni = db is None
+    if vlastni_pripojeni:
+        db = pripojeni_db()
     if not db:
         return
 
@@ -95,25 +273,16 @@ def vytvoreni_tabulky():
 
         if result:
             # Tabulka již existuje
+            doplneni_sloupcu_razeni(cursor)
+            doplneni_sloupce_zavislosti(cursor)
             print("Tabulka úkolů je připravena v databázi.")
         else:
             # Tabulka neexistuje, vytvoření nové tabulky
-            status_enum_hodnoty = (
-                f"'{config.STAV_NEZAHAJENO}', '{config.STAV_PROBIHA}', "
-                f"'{config.STAV_HOTOVO}'"
-            )
-
             print("Tabulka neexistuje, vytvářím ji...")
-            cursor.execute(f"""
-                CREATE TABLE {config.TABLE_TASKS} (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    název VARCHAR(50) NOT NULL UNIQUE,
-                    popis TEXT NOT NULL,
-                    stav ENUM({status_enum_hodnoty}),
-                    datum_vytvoření TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+            vytvor_tabulku_ukolu(cursor)
             print(f"Tabulka '{config.TABLE_TASKS}' byla úspěšně vytvořena.")
+        vytvor_tabulku_zavislosti(cursor)
+        vytvor_tabulky_stitku(cursor)
 
     except mysql.connector.Error as err:
         print(f"Chyba operace s tabulkou: {err}")
@@ -121,23 +290,49 @@ def vytvoreni_tabulky():
     finally:
         if cursor:
             cursor.close()
-        if db and db.is_connected():
+        if vlastni_pripojeni and db.is_connected():
             db.close()
 
 
 def hlavni_menu():
     """
-    Zobrazí hlavní menu s možnostmi výběru podle čísel 1–5.
+    Zobrazí hlavní menu s možnostmi výběru podle čísel 1–6.
     """
     print("\nSprávce úkolů – Hlavní menu")
     print("1. Přidat úkol")
     print("2. Zobrazit úkoly")
     print("3. Aktualizovat úkol")
     print("4. Odstranit úkol")
-    print("5. Ukončit program")
+    print("5. Zobrazit úkoly na řadě")
+    print("6. Ukončit program")
 
 
-def pridat_ukol(db_conn, nazev_ukolu: str, popis_ukolu: str):
+def posledni_vysledek() -> str | None:
+    """
+    Vrátí výsledek poslední operace s úkoly (pridat_ukol, zobrazit_ukoly,
+    aktualizovat_ukol, odstranit_ukol) v aktuálním vlákně.
+    Návratové hodnoty funkcí nerozlišují, proč operace neuspěla
+    (např. kolize názvu nebo chyba databáze), výsledek ano.
+
+    Returns:
+        str | None: Jedna z hodnot VYSLEDEK_* nebo None, pokud vlákno
+        zatím žádnou operaci neprovedlo.
+    """
+    return getattr(_posledni_operace, "vysledek", None)
+
+
+def _zaznamenej_vysledek(vysledek: str):
+    """Uloží výsledek operace pro posledni_vysledek()."""
+    _posledni_operace.vysledek = vysledek
+
+
+def pridat_ukol(
+    db_conn,
+    nazev_ukolu: str,
+    popis_ukolu: str,
+    priorita: int = config.PRIORITA_STREDNI,
+    termin: date | None = None
+):
     """
     Přidá nový úkol do databáze.
 
@@ -145,11 +340,14 @@ def pridat_ukol(db_conn, nazev_ukolu: str, popis_ukolu: str):
         db_conn: Připojení k databázi.
         nazev_ukolu (str): Název nového úkolu.
         popis_ukolu (str): Popis nového úkolu.
+        priorita (int, optional): Priorita úkolu (klíč config.PRIORITY).
+        termin (date | None, optional): Termín splnění úkolu.
 
     Stav úkolu je automaticky nastaven na STAV_NEZAHAJENO.
     Při chybě se provede pokus o rollback a vypíše chybová hláška
     Vrací ID nového úkolu nebo None v případě chyby.
     """
+    _zaznamenej_vysledek(VYSLEDEK_CHYBA)
     if not db_conn or not db_conn.is_connected():
         print("Nepodařilo se připojit k databázi.")
         return None
@@ -161,6 +359,11 @@ def pridat_ukol(db_conn, nazev_ukolu: str, popis_ukolu: str):
         print("Název úkolu a popis nesmí být prázdné.")
         return None
 
+    if priorita not in config.PRIORITY:
+        print(f"Neplatná priorita úkolu: {priorita}.")
+        return None
+
+    db_conn = spojeni_pro_zapis(db_conn)
     cursor = None
     try:
         cursor = db_conn.cursor()
@@ -172,6 +375,7 @@ def pridat_ukol(db_conn, nazev_ukolu: str, popis_ukolu: str):
             (nazev_ukolu_trimmed,)
         )
         if cursor.fetchone():
+            _zaznamenej_vysledek(VYSLEDEK_KOLIZE)
             print(
                 f"Úkol s názvem '{nazev_ukolu_trimmed}' již existuje. "
                 "Zadejte jiný název."
@@ -180,26 +384,161 @@ def pridat_ukol(db_conn, nazev_ukolu: str, popis_ukolu: str):
 
         # Pokud neexistuje, provede vložení
         cursor.execute(f"""
-            INSERT INTO {config.TABLE_TASKS} (název, popis, stav)
-            VALUES (%s, %s, %s)
-        """, (nazev_ukolu_trimmed, popis_ukolu_trimmed, config.STAV_NEZAHAJENO))
+            INSERT INTO {config.TABLE_TASKS}
+                (název, popis, stav, priorita, termin)
+            VALUES (%s, %s, %s, %s, %s)
+        """, (
+            nazev_ukolu_trimmed, popis_ukolu_trimmed,
+            config.STAV_NEZAHAJENO, priorita, termin
+        ))
         db_conn.commit()
         id_ukolu = cursor.lastrowid
+        _zaznamenej_vysledek(VYSLEDEK_OK)
         print(f"Úkol '{nazev_ukolu_trimmed}' byl úspěšně přidán do databáze.")
         return id_ukolu
 
     except mysql.connector.Error as err:
         if db_conn and db_conn.is_connected():
             db_conn.rollback()
-        else:
-            print(f"Chyba při přidávání úkolu do databáze: {err}")
+        if err.errno == errorcode.ER_DUP_ENTRY:  # Souběžné přidání
+            _zaznamenej_vysledek(VYSLEDEK_KOLIZE)
+        print(f"Chyba při přidávání úkolu do databáze: {err}")
         return None
     finally:
         if cursor:
             cursor.close()
 
 
-def zobrazit_ukoly(db_conn, filtr_stavu: str | None = None):
+def sestav_dotaz_ukolu(
+    filtr_stavu: str | None = None,
+    stitky_vse: list[str] | None = None,
+    stitky_nektery: list[str] | None = None,
+    stitky_bez: list[str] | None = None,
+    pocet: int | None = None,
+    od_id: int | None = None
+) -> tuple[str, list]:
+    """
+    Sestaví dotaz pro výpis úkolů s filtrem stavu a štítků.
+    Význam filtrů štítků popisuje funkce podminka_stitku().
+    Parametr od_id omezí výpis na úkoly s vyšším ID (stránkování
+    podle posledního vypsaného ID bez OFFSET).
+
+    Returns:
+        tuple[str, list]: Dotaz SQL a jeho parametry.
+    """
+    dotaz = f"SELECT * FROM {config.TABLE_TASKS}"
+    podminky = []
+    parametry = []
+    if filtr_stavu:
+        podminky.append("stav = %s")
+        parametry.append(filtr_stavu)
+    podminka, parametry_stitku = podminka_stitku(
+        stitky_vse, stitky_nektery, stitky_bez
+    )
+    if podminka:
+        podminky.append(podminka)
+        parametry += parametry_stitku
+    if od_id is not None:
+        podminky.append("id > %s")
+        parametry.append(od_id)
+    if podminky:
+        dotaz += " WHERE " + " AND ".join(podminky)
+    dotaz += " ORDER BY id" # Řazení pro konzistentní výstup
+    if pocet is not None:
+        dotaz += " LIMIT %s"
+        parametry.append(pocet)
+    return dotaz, parametry
+
+
+def stranky_ukolu(
+    cursor,
+    velikost: int,
+    filtr_stavu: str | None = None,
+    stitky_vse: list[str] | None = None,
+    stitky_nektery: list[str] | None = None,
+    stitky_bez: list[str] | None = None
+):
+    """
+    Postupně načítá úkoly po stránkách o velikosti 'velikost'.
+    Každá stránka je samostatný dotaz navazující na poslední ID
+    předchozí stránky, takže se další stránka načte, až když je
+    potřeba, a nevyžádané stránky se nenačtou vůbec. Dotaz načte
+    o jeden řádek víc, podle něj se pozná, zda je stránka poslední.
+
+    Args:
+        cursor: Kurzor vracející řádky jako slovníky.
+        velikost (int): Počet úkolů na stránku.
+        Ostatní argumenty viz filtrovat_ukoly().
+
+    Yields:
+        tuple[list[dict], bool]: Neprázdná stránka úkolů seřazených
+        podle ID a příznak, zda je poslední.
+    """
+    od_id = None
+    while True:
+        cursor.execute(*sestav_dotaz_ukolu(
+            filtr_stavu, stitky_vse, stitky_nektery, stitky_bez,
+            velikost + 1, od_id
+        ))
+        radky = cursor.fetchall()
+        stranka = radky[:velikost]
+        posledni = len(radky) <= velikost
+        if stranka:
+            yield stranka, posledni
+        if posledni:
+            return
+        od_id = stranka[-1]['id']
+
+
+def filtrovat_ukoly(
+    db_conn,
+    filtr_stavu: str | None = None,
+    stitky_vse: list[str] | None = None,
+    stitky_nektery: list[str] | None = None,
+    stitky_bez: list[str] | None = None,
+    pocet: int | None = None
+) -> list[dict]:
+    """
+    Vrátí úkoly odpovídající filtru stavu a štítků, seřazené podle ID.
+    V případě chyby při načítání úkolů vrátí prázdný seznam.
+
+    Args:
+        db_conn: Připojení k databázi.
+        filtr_stavu (str | None, optional): Požadovaný stav úkolů.
+        stitky_vse (list[str] | None, optional): Úkol má všechny štítky.
+        stitky_nektery (list[str] | None, optional): Úkol má alespoň
+            jeden ze štítků.
+        stitky_bez (list[str] | None, optional): Úkol nemá žádný
+            ze štítků.
+        pocet (int | None, optional): Maximální počet vrácených úkolů.
+    """
+    if not db_conn or not db_conn.is_connected():
+        print("Nepodařilo se připojit k databázi.")
+        return []
+
+    db_conn = spojeni_pro_cteni(db_conn)
+    cursor = None
+    try:
+        cursor = db_conn.cursor(dictionary=True)
+        cursor.execute(*sestav_dotaz_ukolu(
+            filtr_stavu, stitky_vse, stitky_nektery, stitky_bez, pocet
+        ))
+        return cursor.fetchall()
+    except mysql.connector.Error as err:
+        print(f"Chyba při načítání úkolů z databáze: {err}")
+        return []
+    finally:
+        if cursor:
+            cursor.close()
+
+
+def zobrazit_ukoly(
+    db_conn,
+    filtr_stavu: str | None = None,
+    stitky_vse: list[str] | None = None,
+    stitky_nektery: list[str] | None = None,
+    stitky_bez: list[str] | None = None
+):
     """
     Zobrazí úkoly z databáze.
 
@@ -208,43 +547,51 @@ def zobrazit_ukoly(db_conn, filtr_stavu: str | None = None):
         filtr_stavu (str | None, optional): Stav, podle kterého se úkoly
             filtrují ('Nezahájeno', 'Probíhá').
             Pokud je None, zobrazí všechny úkoly.
+        stitky_vse (list[str] | None, optional): Zobrazí jen úkoly,
+            které mají všechny zadané štítky.
+        stitky_nektery (list[str] | None, optional): Zobrazí jen úkoly,
+            které mají alespoň jeden ze zadaných štítků.
+        stitky_bez (list[str] | None, optional): Vynechá úkoly,
+            které mají některý ze zadaných štítků.
 
     Pokud je aktivní filtr a nenalezne žádné odpovídající úkoly,
     zobrazí se upozornění. Úkoly jsou seřazeny podle ID.
+    V terminálu se vypisují po stránkách a další stránka se načte
+    z databáze až na pokyn uživatele (viz vystup.py).
     """
+    _zaznamenej_vysledek(VYSLEDEK_CHYBA)
     if not db_conn or not db_conn.is_connected():
         print("Nepodařilo se připojit k databázi.")
         return
 
+    db_conn = spojeni_pro_cteni(db_conn)
+    filtr_stitku = stitky_vse or stitky_nektery or stitky_bez
     cursor = None
     try:
         cursor = db_conn.cursor(dictionary=True)
-        # Dotaz na základě filtru
-        dotaz = f"SELECT * FROM {config.TABLE_TASKS}"
-        parametry = []
-        if filtr_stavu:
-            dotaz += " WHERE stav = %s"
-            parametry.append(filtr_stavu)
-        dotaz += " ORDER BY id" # Řazení pro konzistentní výstup
-
-        cursor.execute(dotaz, parametry)
-        ukoly = cursor.fetchall()
+        # Dotaz na základě filtru, stránky se načítají postupně
+        velikost = velikost_stranky()
+        stranky = stranky_ukolu(
+            cursor, velikost,
+            filtr_stavu, stitky_vse, stitky_nektery, stitky_bez
+        )
+        prvni_stranka = next(stranky, None)
 
-        if not ukoly:
-            if filtr_stavu: # Pokud byl aktivní filtr a nic nenašel
+        if not prvni_stranka:
+            if filtr_stitku: # Pokud byl aktivní filtr štítků
+                print("\nŽádné úkoly odpovídající filtru nebyly nalezeny.")
+            elif filtr_stavu: # Pokud byl aktivní filtr a nic nenašel
                 print(
                     f"\nŽádné úkoly se stavem '{filtr_stavu}' nebyly nalezeny."
                 )
             else: # Pokud nebyl aktivní filtr
                 print("\nV tabulce nejsou žádné úkoly.")
+            _zaznamenej_vysledek(VYSLEDEK_OK)
             return
 
         print("\nSeznam úkolů:")
-        for ukol in ukoly:
-            print(
-                f"{ukol['id']}. {ukol['název']} – {ukol['popis']} "
-                f"(Stav: {ukol['stav']})"
-            )
+        vypis_po_strankach(chain([prvni_stranka], stranky), SLOUPCE_UKOLU)
+        _zaznamenej_vysledek(VYSLEDEK_OK)
 
     except mysql.connector.Error as err:
         print(f"Chyba při načítání úkolů z databáze: {err}")
@@ -253,6 +600,88 @@ def zobrazit_ukoly(db_conn, filtr_stavu: str | None = None):
             cursor.close()
 
 
+def popis_priority_a_terminu(ukol: dict) -> str:
+    """
+    Vrátí textový popis priority a termínu úkolu pro výpis.
+
+    Args:
+        ukol (dict): Řádek úkolu se sloupci 'priorita' a 'termin'.
+    """
+    popis = f"Priorita: {config.PRIORITY.get(ukol['priorita'], '?')}"
+    if ukol['termin']:
+        popis += f", Termín: {ukol['termin']:%d.%m.%Y}"
+    return popis
+
+
+# Dotaz pro úkoly na řadě, odpovídá pořadí indexu idx_dalsi_ukoly
+DOTAZ_DALSI_UKOLY = f"""
+    SELECT id, název, popis, stav, priorita, termin
+    FROM {config.TABLE_TASKS} FORCE INDEX (idx_dalsi_ukoly)
+    WHERE aktivni = 1
+    ORDER BY priorita, termin_razeni, id
+    LIMIT %s
+"""
+
+
+def dalsi_ukoly(
+    db_conn, pocet: int = config.POCET_DALSICH_UKOLU
+) -> list[dict]:
+    """
+    Vrátí nejbližších N nedokončených úkolů, které jsou na řadě.
+    Úkoly jsou seřazeny podle priority, poté podle termínu (úkoly
+    bez termínu na konci) a nakonec podle ID.
+    V případě chyby při načítání úkolů vrátí prázdný seznam.
+
+    Dotaz odpovídá pořadí indexu idx_dalsi_ukoly, databáze proto čte
+    jen prvních N položek indexu a doba odezvy nezávisí na velikosti
+    tabulky.
+
+    Args:
+        db_conn: Připojení k databázi.
+        pocet (int, optional): Maximální počet vrácených úkolů.
+    """
+    if not db_conn or not db_conn.is_connected():
+        print("Nepodařilo se připojit k databázi.")
+        return []
+
+    db_conn = spojeni_pro_cteni(db_conn)
+    cursor = None
+    try:
+        cursor = db_conn.cursor(dictionary=True)
+        cursor.execute(DOTAZ_DALSI_UKOLY, (pocet,))
+        return cursor.fetchall()
+    except mysql.connector.Error as err:
+        print(f"Chyba při načítání úkolů na řadě: {err}")
+        return []
+    finally:
+        if cursor:
+            cursor.close()
+
+
+def zobrazit_dalsi_ukoly(
+    db_conn, pocet: int = config.POCET_DALSICH_UKOLU
+):
+    """
+    Zobrazí nejbližších N nedokončených úkolů podle priority a termínu.
+
+    Args:
+        db_conn: Připojení k databázi.
+        pocet (int, optional): Maximální počet zobrazených úkolů.
+    """
+    ukoly = dalsi_ukoly(db_conn, pocet)
+    if not ukoly:
+        print("\nŽádné nedokončené úkoly nejsou na řadě.")
+        return
+
+    print(f"\nÚkoly na řadě (nejvýše {pocet}):")
+    for poradi, ukol in enumerate(ukoly, start=1):
+        print(
+            f"{poradi}. [ID {ukol['id']}] {ukol['název']} – "
+            f"{ukol['popis']} (Stav: {ukol['stav']}, "
+            f"{popis_priority_a_terminu(ukol)})"
+        )
+
+
 def ziskej_ukoly_pro_vyber(db_conn) -> list[dict]:
     """
     Vrátí seznam úkolů (ID, název, stav) pro výběr.
@@ -265,6 +694,7 @@ def ziskej_ukoly_pro_vyber(db_conn) -> list[dict]:
         print("Nepodařilo se připojit k databázi.")
         return []
 
+    db_conn = spojeni_pro_cteni(db_conn)
     cursor = None
     try:
         cursor = db_conn.cursor(dictionary=True)
@@ -300,48 +730,85 @@ def priprav_a_zobraz_ukoly_pro_vyber(db_conn, cinnost: str) -> list[int]:
         return []
 
     print(f"\nSeznam úkolů k {cinnost}:")
-    platna_id = []
-    for ukol_data in ukoly_k_vyberu:
-        print(
-            f"{ukol_data['id']}. {ukol_data['název']} "
-            f"(Aktuální stav: {ukol_data['stav']})"
-        )
-        platna_id.append(ukol_data['id'])
-    return platna_id
+    vypis_po_strankach(stranky_seznamu(ukoly_k_vyberu), SLOUPCE_VYBERU)
+    return [ukol_data['id'] for ukol_data in ukoly_k_vyberu]
 
 
-def aktualizovat_ukol(db_conn, ukol_id: int, novy_stav: str) -> bool:
+def aktualizovat_ukol(
+    db_conn,
+    ukol_id: int,
+    novy_stav: str,
+    priorita: int | None = None,
+    termin: date | None | object = BEZE_ZMENY
+) -> bool:
     """
-    Aktualizuje stav existujícího úkolu v databázi.
+    Aktualizuje stav existujícího úkolu v databázi,
+    případně i jeho prioritu a termín.
 
     Args:
         db_conn: Připojení k databázi.
         ukol_id (int): ID úkolu, který se má aktualizovat.
         novy_stav (str): Nový stav úkolu (STAV_PROBIHA nebo STAV_HOTOVO).
+        priorita (int | None, optional): Nová priorita úkolu.
+            Pokud je None, priorita se nemění.
+        termin (date | None, optional): Nový termín úkolu.
+            None termín zruší, BEZE_ZMENY (výchozí) jej ponechá.
 
     Vrací True, pokud byla aktualizace úspěšná, jinak False
     Při chybě se provede pokus o rollback a vypíše chybová hláška.
     """
+    _zaznamenej_vysledek(VYSLEDEK_CHYBA)
     if not db_conn or not db_conn.is_connected():
         print("Nepodařilo se připojit k databázi.")
         return False
 
+    if priorita is not None and priorita not in config.PRIORITY:
+        print(f"Neplatná priorita úkolu: {priorita}.")
+        return False
+
+    sloupce = ["stav = %s"]
+    parametry = [novy_stav]
+    if priorita is not None:
+        sloupce.append("priorita = %s")
+        parametry.append(priorita)
+    if termin is not BEZE_ZMENY:
+        sloupce.append("termin = %s")
+        parametry.append(termin)
+    parametry.append(ukol_id)
+
+    db_conn = spojeni_pro_zapis(db_conn)
     cursor = None
     try:
         cursor = db_conn.cursor()
-        aktualizace = f"UPDATE {config.TABLE_TASKS} SET stav = %s WHERE id = %s"
-        cursor.execute(aktualizace, (novy_stav, ukol_id))
-        db_conn.commit()
-        if cursor.rowcount > 0:
+        # Původní stav je potřeba pro úpravu závislých úkolů
+        cursor.execute(
+            f"SELECT stav FROM {config.TABLE_TASKS} WHERE id = %s FOR UPDATE",
+            (ukol_id,)
+        )
+        puvodni = cursor.fetchone()
+        # Existenci úkolu určuje tento řádek, ne rowcount příkazu UPDATE,
+        # který je 0 i tehdy, když se hodnoty nezmění
+        if puvodni is None:
+            db_conn.rollback()
+            _zaznamenej_vysledek(VYSLEDEK_NENALEZENO)
             print(
-                f"Stav úkolu s ID {ukol_id} byl úspěšně aktualizován na "
-                f"'{novy_stav}'."
+                f"Úkol s ID {ukol_id} nebyl nalezen nebo aktualizace selhala."
             )
-            return True
+            return False
+
+        aktualizace = (
+            f"UPDATE {config.TABLE_TASKS} SET {', '.join(sloupce)} "
+            "WHERE id = %s"
+        )
+        cursor.execute(aktualizace, parametry)
+        pri_zmene_stavu(cursor, ukol_id, puvodni[0], novy_stav)
+        db_conn.commit()
+        _zaznamenej_vysledek(VYSLEDEK_OK)
         print(
-            f"Úkol s ID {ukol_id} nebyl nalezen nebo aktualizace selhala."
+            f"Stav úkolu s ID {ukol_id} byl úspěšně aktualizován na "
+            f"'{novy_stav}'."
         )
-        return False
+        return True
 
     except mysql.connector.Error as err:
         if db_conn:
@@ -363,19 +830,31 @@ def odstranit_ukol(db_conn, ukol_id: int) -> bool:
 
     Vrací True, pokud bylo odstranění úspěšné, jinak False.
     """
+    _zaznamenej_vysledek(VYSLEDEK_CHYBA)
     if not db_conn or not db_conn.is_connected():
         print("Nepodařilo se připojit k databázi.")
         return False
 
+    db_conn = spojeni_pro_zapis(db_conn)
     cursor = None
     try:
         cursor = db_conn.cursor()
+        cursor.execute(
+            f"SELECT stav FROM {config.TABLE_TASKS} WHERE id = %s FOR UPDATE",
+            (ukol_id,)
+        )
+        puvodni = cursor.fetchone()
+        if puvodni:
+            # Uvolnění úkolů, které na odstraňovaném úkolu závisí
+            pred_odstranenim(cursor, ukol_id, puvodni[0])
         odstraneni_dotazu = f"DELETE FROM {config.TABLE_TASKS} WHERE id = %s"
         cursor.execute(odstraneni_dotazu, (ukol_id,))
         db_conn.commit()
         if cursor.rowcount > 0:
+            _zaznamenej_vysledek(VYSLEDEK_OK)
             print(f"Úkol s ID {ukol_id} byl úspěšně odstraněn z databáze.")
             return True
+        _zaznamenej_vysledek(VYSLEDEK_NENALEZENO)
         print(
             f"Úkol s ID {ukol_id} nebyl nalezen nebo odstranění selhalo."
         )
@@ -435,6 +914,60 @@ def ziskej_stav(vyzva: str, povolene_stavy: list[str]) -> str:
         print(f"Neplatný stav. Zadejte jeden z: {', '.join(povolene_stavy)}.")
 
 
+def ziskej_prioritu(vyzva: str) -> int | None:
+    """
+    Získá od uživatele prioritu úkolu (číslo z config.PRIORITY).
+    Opakovaně vyzývá k zadání, dokud není vstup platný.
+    Prázdný vstup znamená, že priorita nebyla zadána.
+
+    Args:
+        vyzva (str): Zpráva zobrazená uživateli pro zadání priority.
+
+    Returns:
+        int | None: Zadaná priorita nebo None při prázdném vstupu.
+    """
+    while True:
+        vstup = input(vyzva).strip()
+        if not vstup:
+            return None
+        if vstup.isdigit() and int(vstup) in config.PRIORITY:
+            return int(vstup)
+        moznosti = ", ".join(
+            f"{cislo} = {nazev}" for cislo, nazev in config.PRIORITY.items()
+        )
+        print(f"Neplatná priorita. Zadejte jednu z: {moznosti}.")
+
+
+def ziskej_termin(
+    vyzva: str, pri_prazdnem=None, povolit_zruseni: bool = False
+):
+    """
+    Získá od uživatele termín úkolu ve tvaru DD.MM.RRRR.
+    Opakovaně vyzývá k zadání, dokud není vstup platný.
+
+    Args:
+        vyzva (str): Zpráva zobrazená uživateli pro zadání termínu.
+        pri_prazdnem (optional): Hodnota vrácená při prázdném vstupu
+            (výchozí None = termín nebyl zadán).
+        povolit_zruseni (bool, optional): Vstup '-' vrátí None
+            (zrušení termínu).
+
+    Returns:
+        Zadaný termín (date), None nebo hodnota pri_prazdnem.
+    """
+    while True:
+        vstup = input(vyzva).strip()
+        if not vstup:
+            return pri_prazdnem
+        if povolit_zruseni and vstup == "-":
+            return None
+        try:
+            den, mesic, rok = (int(cast) for cast in vstup.split("."))
+            return date(rok, mesic, den)
+        except ValueError:
+            print("Neplatné datum. Zadejte termín ve tvaru DD.MM.RRRR.")
+
+
 def spustit_aplikaci(db_main_conn):
     """
     Spustí hlavní smyčku aplikace pro interakci s uživatelem.
@@ -451,10 +984,10 @@ def spustit_aplikaci(db_main_conn):
 
         volba_menu = ""
         while True:
-            volba_menu = input("Vyberte možnost (1–5): ")
-            if volba_menu in ["1", "2", "3", "4", "5"]:
+            volba_menu = input("Vyberte možnost (1–6): ")
+            if volba_menu in ["1", "2", "3", "4", "5", "6"]:
                 break
-            print("\nNeplatná volba. Zadejte číslo mezi 1 a 5.")
+            print("\nNeplatná volba. Zadejte číslo mezi 1 a 6.")
 
         if volba_menu == "1":
             novy_nazev = ""
@@ -470,7 +1003,24 @@ def spustit_aplikaci(db_main_conn):
                 if novy_popis:
                     break
                 print("\nPopis úkolu nesmí být prázdný.")
-            pridat_ukol(db_main_conn, novy_nazev, novy_popis)
+
+            nova_priorita = ziskej_prioritu(
+                "Zadejte prioritu (1 = vysoká, 2 = střední, 3 = nízká, "
+                "Enter = střední): "
+            )
+            novy_termin = ziskej_termin(
+                "Zadejte termín (DD.MM.RRRR, Enter = bez termínu): "
+            )
+            nove_stitky = rozloz_stitky(input(
+                "Zadejte štítky oddělené čárkou (Enter = bez štítků): "
+            ))
+            id_noveho = pridat_ukol(
+                db_main_conn, novy_nazev, novy_popis,
+                nova_priorita or config.PRIORITA_STREDNI, novy_termin
+            )
+            if id_noveho is not None:
+                for stitek in nove_stitky:
+                    oznacit_ukoly(db_main_conn, stitek, [id_noveho])
 
         elif volba_menu == "2":
             filtr_zobrazeni = None
@@ -493,7 +1043,31 @@ def spustit_aplikaci(db_main_conn):
                         [config.STAV_NEZAHAJENO, config.STAV_PROBIHA]
                     )
                     break
-            zobrazit_ukoly(db_main_conn, filtr_zobrazeni)
+
+            stitky_vse = stitky_nektery = stitky_bez = None
+            while True:
+                chce_stitky = input(
+                    "Chcete filtrovat úkoly podle štítků? (ano/ne): "
+                ).strip().lower()
+                if chce_stitky in ['ano', 'ne']:
+                    break
+                print("Neplatná odpověď. Zadejte 'ano' nebo 'ne'.")
+
+            if chce_stitky == 'ano':
+                print("Štítky oddělte čárkou, Enter = bez omezení.")
+                stitky_vse = rozloz_stitky(
+                    input("Úkol má všechny štítky: ")
+                )
+                stitky_nektery = rozloz_stitky(
+                    input("Úkol má alespoň jeden ze štítků: ")
+                )
+                stitky_bez = rozloz_stitky(
+                    input("Úkol nemá žádný ze štítků: ")
+                )
+            zobrazit_ukoly(
+                db_main_conn, filtr_zobrazeni,
+                stitky_vse, stitky_nektery, stitky_bez
+            )
 
         elif volba_menu == "3":
             platne_id_pro_aktualizaci = priprav_a_zobraz_ukoly_pro_vyber(
@@ -510,8 +1084,17 @@ def spustit_aplikaci(db_main_conn):
                     f"({config.STAV_PROBIHA} nebo {config.STAV_HOTOVO}): ",
                     [config.STAV_PROBIHA, config.STAV_HOTOVO]
                 )
+                nova_priorita = ziskej_prioritu(
+                    "Zadejte novou prioritu (1–3, Enter = beze změny): "
+                )
+                novy_termin = ziskej_termin(
+                    "Zadejte nový termín (DD.MM.RRRR, Enter = beze změny, "
+                    "- = zrušit termín): ",
+                    pri_prazdnem=BEZE_ZMENY, povolit_zruseni=True
+                )
                 aktualizovat_ukol(
-                    db_main_conn, id_pro_aktualizaci, novy_stav_ukolu
+                    db_main_conn, id_pro_aktualizaci, novy_stav_ukolu,
+                    nova_priorita, novy_termin
                 )
 
         elif volba_menu == "4":
@@ -527,6 +1110,9 @@ def spustit_aplikaci(db_main_conn):
                 odstranit_ukol(db_main_conn, id_pro_odstraneni)
 
         elif volba_menu == "5":
+            zobrazit_dalsi_ukoly(db_main_conn)
+
+        elif volba_menu == "6":
             print("\nKonec programu.")
             break
 
@@ -534,7 +1120,7 @@ def spustit_aplikaci(db_main_conn):
 if __name__ == "__main__":
     vytvoreni_databaze()
     vytvoreni_tabulky()
-    db_main_conn = pripojeni_db()
+    db_main_conn = pripojeni_smerovac()
 
     spustit_aplikaci(db_main_conn)
 
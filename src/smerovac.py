@@ -0,0 +1,249 @@
+"""
+Směrování dotazů mezi primární databází a replikami pro čtení.
+Zápisy jdou vždy na primár, čtení (výpisy úkolů) se rozkládají
+na repliky metodou round-robin.
+Základní vlastnosti:
+- read-your-writes: po zápisu si relace zjistí pozici primáru (GTID)
+  a čte jen z replik, které ji už provedly; ostatní přeskočí
+  a pokud žádná replika není dost aktuální, čte z primáru. Bez GTID
+  čte relace po zápisu po danou dobu z primáru.
+- čtení z replik běží v režimu autocommit, takže každé čtení vidí
+  aktuální data repliky (ne snímek z první transakce relace)
+- přeskočení nedostupné repliky a návrat na primár, pokud jsou
+  všechny repliky mimo provoz; replika, ke které se nepodařilo
+  připojit, se po uplynutí pauzy připojí znovu
+- funkce spojeni_pro_cteni() a spojeni_pro_zapis() přijímají
+  i obyčejné připojení, takže stávající kód funguje beze změn
+"""
+import time
+from collections.abc import Callable
+
+import mysql.connector
+
+from . import config
+
+
+def rozloz_adresu(adresa: str) -> tuple[str, int]:
+    """
+    Rozloží adresu repliky ve tvaru "host" nebo "host:port".
+
+    Args:
+        adresa (str): Adresa repliky z config.DB_REPLIKY.
+
+    Returns:
+        tuple[str, int]: Host a port (výchozí port MySQL je 3306).
+    """
+    host, _, port = adresa.strip().partition(":")
+    return host, int(port) if port else 3306
+
+
+class SmerovacSpojeni:
+    """
+    Relace nad primárním připojením a seznamem replik.
+
+    Navenek se chová jako připojení (is_connected(), close()),
+    takže jej lze předat funkcím z main.py místo obyčejného připojení.
+    """
+
+    def __init__(
+        self,
+        primarni,
+        repliky: list | None = None,
+        pripojit_repliku: Callable[[int], object] | None = None,
+        okno_po_zapisu: float = config.DB_OKNO_PO_ZAPISU_S,
+        pauza_repliky: float = config.DB_PAUZA_REPLIKY_S,
+        hodiny=time.monotonic,
+    ):
+        """
+        Args:
+            primarni: Připojení k primární databázi.
+            repliky (list | None): Připojení k replikám. Položka None
+                označuje repliku, ke které se zatím nepodařilo připojit.
+                Připojením se zapne autocommit.
+            pripojit_repliku (Callable[[int], object] | None): Funkce,
+                která podle indexu repliky vytvoří nové připojení
+                (nebo vrátí None). Používá se pro repliky bez připojení.
+            okno_po_zapisu (float): Doba v sekundách, po kterou se
+                po zápisu čte z primáru, pokud primár nepoužívá GTID.
+            pauza_repliky (float): Doba v sekundách, po kterou se
+                nedostupná replika nezkouší.
+            hodiny: Funkce vracející aktuální čas (kvůli testům).
+        """
+        self.primarni = primarni
+        self.repliky = list(repliky or [])
+        self._pripojit_repliku = pripojit_repliku
+        for replika in self.repliky:
+            if replika is not None:
+                self._zapni_autocommit(replika)
+        self.okno_po_zapisu = okno_po_zapisu
+        self.pauza_repliky = pauza_repliky
+        self._hodiny = hodiny
+        self._dalsi_replika = 0
+        self._posledni_zapis: float | None = None
+        self._ceka_na_pozici = False
+        self._pozice_zapisu: str | None = None
+        self._dohnane: set[int] = set()
+        self._nedostupne_do: dict[int, float] = {}
+
+    def is_connected(self) -> bool:
+        """Relace je použitelná, dokud je dostupný primár."""
+        return bool(self.primarni) and self.primarni.is_connected()
+
+    def pro_zapis(self):
+        """
+        Vrátí primární připojení a zaznamená zápis, aby následná
+        čtení v této relaci viděla provedené změny. Pozice primáru
+        se zjistí až při dalším čtení, kdy je zápis potvrzený.
+        """
+        self._posledni_zapis = self._hodiny()
+        self._ceka_na_pozici = True
+        return self.primarni
+
+    def pro_cteni(self):
+        """
+        Vrátí připojení pro čtení.
+        Vrací další dostupnou repliku v pořadí round-robin, po zápisu
+        jen repliku, která již provedla vlastní zápisy relace
+        (read-your-writes). Pokud taková replika není, vrátí primár.
+        """
+        if not self.repliky:
+            return self.primarni
+        ted = self._hodiny()
+        if self._ceka_na_pozici:
+            self._ceka_na_pozici = False
+            self._pozice_zapisu = self._pozice_primaru()
+            self._dohnane = set()
+            if self._pozice_zapisu is not None:
+                # Aktuálnost replik se ověří podle GTID, okno není třeba
+                self._posledni_zapis = None
+        if (
+            self._posledni_zapis is not None
+            and ted - self._posledni_zapis < self.okno_po_zapisu
+        ):
+            return self.primarni
+
+        pocet = len(self.repliky)
+        for posun in range(pocet):
+            index = (self._dalsi_replika + posun) % pocet
+            if self._nedostupne_do.get(index, 0) > ted:
+                continue
+            if self._je_dostupna(index):
+                self._nedostupne_do.pop(index, None)
+                if not self._je_aktualni(index):
+                    continue
+                self._dalsi_replika = (index + 1) % pocet
+                return self.repliky[index]
+            print(f"Replika č. {index + 1} je nedostupná, přeskakuji ji.")
+            self._nedostupne_do[index] = ted + self.pauza_repliky
+        return self.primarni
+
+    def _pozice_primaru(self) -> str | None:
+        """
+        Vrátí množinu transakcí provedených na primáru (GTID)
+        nebo None, pokud primár GTID nepoužívá.
+        """
+        cursor = None
+        try:
+            cursor = self.primarni.cursor()
+            cursor.execute("SELECT @@GLOBAL.gtid_executed")
+            radek = cursor.fetchone()
+            return radek[0] if radek and radek[0] else None
+        except mysql.connector.Error as err:
+            print(f"Chyba při zjišťování pozice primáru: {err}")
+            return None
+        finally:
+            if cursor:
+                cursor.close()
+
+    def _je_aktualni(self, index: int) -> bool:
+        """
+        Ověří, zda replika již provedla všechny transakce z pozice
+        posledního zápisu relace. Replika, která pozici jednou dohnala,
+        se do dalšího zápisu už neověřuje.
+        """
+        if self._pozice_zapisu is None or index in self._dohnane:
+            return True
+        cursor = None
+        try:
+            cursor = self.repliky[index].cursor()
+            cursor.execute(
+                "SELECT GTID_SUBSET(%s, @@GLOBAL.gtid_executed)",
+                (self._pozice_zapisu,)
+            )
+            radek = cursor.fetchone()
+        except mysql.connector.Error:
+            return False
+        finally:
+            if cursor:
+                cursor.close()
+        if radek and radek[0] == 1:
+            self._dohnane.add(index)
+            return True
+        return False
+
+    def _je_dostupna(self, index: int) -> bool:
+        """
+        Ověří spojení s replikou a případně se pokusí o obnovení.
+        Repliku bez připojení se pokusí připojit znovu.
+        """
+        replika = self.repliky[index]
+        if replika is None:
+            if self._pripojit_repliku is None:
+                return False
+            replika = self._pripojit_repliku(index)
+            if replika is None:
+                return False
+            self.repliky[index] = replika
+            self._zapni_autocommit(replika)
+        try:
+            if replika.is_connected():
+                return True
+            replika.reconnect(attempts=1, delay=0)
+            if not replika.is_connected():
+                return False
+            self._zapni_autocommit(replika)
+            return True
+        except mysql.connector.Error:
+            return False
+
+    @staticmethod
+    def _zapni_autocommit(replika):
+        """
+        Zapne autocommit. Jinak by první čtení otevřelo transakci
+        a všechna další čtení by v režimu REPEATABLE READ viděla
+        stále stejný snímek dat.
+        """
+        try:
+            if not replika.autocommit:
+                replika.autocommit = True
+        except mysql.connector.Error as err:
+            print(f"Chyba při nastavení repliky: {err}")
+
+    def close(self):
+        """Uzavře primární připojení i všechna připojení k replikám."""
+        for spojeni in [self.primarni, *self.repliky]:
+            try:
+                if spojeni and spojeni.is_connected():
+                    spojeni.close()
+            except mysql.connector.Error as err:
+                print(f"Chyba při uzavírání připojení: {err}")
+
+
+def spojeni_pro_cteni(db_conn):
+    """
+    Vrátí připojení vhodné pro dotaz, který pouze čte.
+    Obyčejné připojení vrací beze změny.
+    """
+    if isinstance(db_conn, SmerovacSpojeni):
+        return db_conn.pro_cteni()
+    return db_conn
+
+
+def spojeni_pro_zapis(db_conn):
+    """
+    Vrátí připojení vhodné pro zápis (vždy primár).
+    Obyčejné připojení vrací beze změny.
+    """
+    if isinstance(db_conn, SmerovacSpojeni):
+        return db_conn.pro_zapis()
+    return db_conn
@@ -0,0 +1,215 @@
+"""
+Štítky úkolů (např. tým, komponenta, sprint).
+Štítky jsou uložené v tabulce 'stitky', jejich přiřazení k úkolům
+ve spojovací tabulce 'ukoly_stitky'. Výpis úkolů lze filtrovat
+kombinací štítků:
+- všechny ze seznamu (AND)
+- alespoň jeden ze seznamu (OR)
+- žádný ze seznamu (NOT)
+Filtry se vyhodnocují v SQL, hromadné přiřazení štítku mnoha úkolům
+probíhá jedním příkazem INSERT.
+"""
+import json
+
+import mysql.connector
+
+from . import config
+from .smerovac import spojeni_pro_zapis
+
+MAX_DELKA_STITKU = 50
+
+
+def vytvor_tabulky_stitku(cursor):
+    """
+    Vytvoří tabulky štítků a jejich přiřazení pomocí předaného kurzoru,
+    pokud neexistují.
+    Primární klíč (stitek_id, ukol_id) slouží k vyhledání úkolů
+    se štítkem, index idx_ukol k vyhledání štítků úkolu.
+    """
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {config.TABLE_TAGS} (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            název VARCHAR({MAX_DELKA_STITKU}) NOT NULL UNIQUE
+        )
+    """)
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {config.TABLE_TASK_TAGS} (
+            stitek_id INT NOT NULL,
+            ukol_id INT NOT NULL,
+            PRIMARY KEY (stitek_id, ukol_id),
+            INDEX idx_ukol (ukol_id),
+            FOREIGN KEY (stitek_id)
+                REFERENCES {config.TABLE_TAGS} (id) ON DELETE CASCADE,
+            FOREIGN KEY (ukol_id)
+                REFERENCES {config.TABLE_TASKS} (id) ON DELETE CASCADE
+        )
+    """)
+
+
+def rozloz_stitky(text: str) -> list[str]:
+    """
+    Rozloží štítky zadané uživatelem oddělené čárkou.
+    Prázdné položky a duplicity vynechá, pořadí zachová.
+    """
+    return list(dict.fromkeys(
+        stitek.strip() for stitek in text.split(",") if stitek.strip()
+    ))
+
+
+def podminka_stitku(
+    stitky_vse: list[str] | None = None,
+    stitky_nektery: list[str] | None = None,
+    stitky_bez: list[str] | None = None
+) -> tuple[str, list]:
+    """
+    Sestaví podmínku WHERE pro filtrování úkolů podle štítků.
+
+    Args:
+        stitky_vse (list[str] | None): Úkol musí mít všechny štítky.
+        stitky_nektery (list[str] | None): Úkol musí mít alespoň jeden.
+        stitky_bez (list[str] | None): Úkol nesmí mít žádný z nich.
+
+    Returns:
+        tuple[str, list]: Podmínka nad sloupcem 'id' tabulky úkolů
+        (prázdný řetězec, pokud není zadán žádný filtr) a její parametry.
+    """
+    def poddotaz(nazvy: list[str]) -> str:
+        zastupne = ", ".join(["%s"] * len(nazvy))
+        return (
+            f"SELECT us.ukol_id FROM {config.TABLE_TASK_TAGS} us "
+            f"JOIN {config.TABLE_TAGS} s ON s.id = us.stitek_id "
+            f"WHERE s.název IN ({zastupne})"
+        )
+
+    podminky = []
+    parametry = []
+    if stitky_vse:
+        # Názvy porovnává databáze podle collation sloupce (např. bez
+        # ohledu na velikost písmen), proto se počet požadovaných štítků
+        # nepočítá v Pythonu, ale z odpovídajících řádků tabulky štítků.
+        # Neexistující štítek by se do počtu nepromítl, proto se navíc
+        # ověřuje existence každého zadaného názvu.
+        nazvy = list(dict.fromkeys(stitky_vse))
+        zastupne = ", ".join(["%s"] * len(nazvy))
+        podminky.append(
+            f"id IN ({poddotaz(nazvy)} "
+            "GROUP BY us.ukol_id HAVING COUNT(DISTINCT us.stitek_id) = "
+            f"(SELECT COUNT(*) FROM {config.TABLE_TAGS} "
+            f"WHERE název IN ({zastupne})))"
+        )
+        parametry += [*nazvy, *nazvy]
+        for nazev in nazvy:
+            podminky.append(
+                f"EXISTS (SELECT 1 FROM {config.TABLE_TAGS} WHERE název = %s)"
+            )
+            parametry.append(nazev)
+    if stitky_nektery:
+        podminky.append(f"id IN ({poddotaz(stitky_nektery)})")
+        parametry += stitky_nektery
+    if stitky_bez:
+        podminky.append(f"id NOT IN ({poddotaz(stitky_bez)})")
+        parametry += stitky_bez
+    return " AND ".join(podminky), parametry
+
+
+def oznacit_ukoly(
+    db_conn, nazev_stitku: str, ukol_ids: list[int]
+) -> int | None:
+    """
+    Přiřadí štítek všem zadaným úkolům. Neexistující štítek vytvoří.
+    Všechny úkoly se označí jedním příkazem – seznam ID se předá
+    jako jediný parametr (pole JSON rozložené funkcí JSON_TABLE).
+    Neexistující ID úkolů a již existující přiřazení se přeskočí.
+
+    Args:
+        db_conn: Připojení k databázi.
+        nazev_stitku (str): Název štítku.
+        ukol_ids (list[int]): ID úkolů, které se mají označit.
+
+    Vrací počet nově označených úkolů nebo None v případě chyby.
+    """
+    if not db_conn or not db_conn.is_connected():
+        print("Nepodařilo se připojit k databázi.")
+        return None
+
+    nazev_stitku = nazev_stitku.strip()
+    if not nazev_stitku or len(nazev_stitku) > MAX_DELKA_STITKU:
+        print(
+            f"Název štítku nesmí být prázdný ani delší "
+            f"než {MAX_DELKA_STITKU} znaků."
+        )
+        return None
+
+    db_conn = spojeni_pro_zapis(db_conn)
+    cursor = None
+    try:
+        cursor = db_conn.cursor()
+        # LAST_INSERT_ID(id) vrátí ID i u již existujícího štítku
+        cursor.execute(
+            f"INSERT INTO {config.TABLE_TAGS} (název) VALUES (%s) "
+            "ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id)",
+            (nazev_stitku,)
+        )
+        stitek_id = cursor.lastrowid
+        cursor.execute(f"""
+            INSERT IGNORE INTO {config.TABLE_TASK_TAGS} (stitek_id, ukol_id)
+            SELECT %s, u.id
+            FROM JSON_TABLE(%s, '$[*]' COLUMNS (id INT PATH '$')) j
+            JOIN {config.TABLE_TASKS} u ON u.id = j.id
+        """, (stitek_id, json.dumps([int(i) for i in ukol_ids])))
+        pocet = cursor.rowcount
+        db_conn.commit()
+        print(f"Štítek '{nazev_stitku}' byl přiřazen {pocet} úkolům.")
+        return pocet
+
+    except mysql.connector.Error as err:
+        if db_conn:
+            db_conn.rollback()
+        print(f"Chyba při přiřazování štítku: {err}")
+        return None
+    finally:
+        if cursor:
+            cursor.close()
+
+
+def odznacit_ukoly(
+    db_conn, nazev_stitku: str, ukol_ids: list[int]
+) -> int | None:
+    """
+    Odebere štítek všem zadaným úkolům jedním příkazem.
+
+    Args:
+        db_conn: Připojení k databázi.
+        nazev_stitku (str): Název štítku.
+        ukol_ids (list[int]): ID úkolů, kterým se má štítek odebrat.
+
+    Vrací počet úkolů, kterým byl štítek odebrán, nebo None při chybě.
+    """
+    if not db_conn or not db_conn.is_connected():
+        print("Nepodařilo se připojit k databázi.")
+        return None
+
+    db_conn = spojeni_pro_zapis(db_conn)
+    cursor = None
+    try:
+        cursor = db_conn.cursor()
+        cursor.execute(f"""
+            DELETE us FROM {config.TABLE_TASK_TAGS} us
+            JOIN {config.TABLE_TAGS} s ON s.id = us.stitek_id
+            JOIN JSON_TABLE(%s, '$[*]' COLUMNS (id INT PATH '$')) j
+                ON j.id = us.ukol_id
+            WHERE s.název = %s
+        """, (json.dumps([int(i) for i in ukol_ids]), nazev_stitku.strip()))
+        pocet = cursor.rowcount
+        db_conn.commit()
+        print(f"Štítek '{nazev_stitku}' byl odebrán {pocet} úkolům.")
+        return pocet
+
+    except mysql.connector.Error as err:
+        if db_conn:
+            db_conn.rollback()
+        print(f"Chyba při odebírání štítku: {err}")
+        return None
+    finally:
+        if cursor:
+            cursor.close()
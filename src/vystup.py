@@ -0,0 +1,183 @@
+"""
+Výpis dlouhých seznamů úkolů do terminálu nebo roury.
+Řádky se formátují po dávkách do zarovnaných sloupců a zapisují
+jedním voláním write() na dávku místo jednoho print() na řádek.
+Režimy:
+- interaktivní (stdout i stdin jsou terminál): výpis po stránkách
+  podle výšky terminálu, další stránka se načte až na pokyn uživatele
+  a po ukončení ('q') se už nic dalšího nenačítá
+- rychlý (výstup je přesměrován): velké dávky bez dotazů na uživatele,
+  sloupce se nezkracují
+Pokud čtenář roury skončí dřív (např. head), program se ukončí.
+"""
+import os
+import shutil
+import sys
+from collections.abc import Callable, Iterable
+
+# Počet řádků na jeden dotaz do databáze v rychlém režimu
+VELIKOST_DAVKY = 5000
+# Řádky terminálu rezervované pro záhlaví a výzvu stránkovače
+REZERVA_RADKU = 3
+MIN_SIRKA_POSLEDNIHO = 10
+
+# Sloupec výpisu: (záhlaví, funkce vracející hodnotu z řádku, šířka)
+# Šířka None u posledního sloupce znamená "zbytek řádku".
+Sloupec = tuple[str, Callable[[dict], object], int | None]
+# Stránka výpisu: (řádky, příznak poslední stránky)
+Stranka = tuple[list[dict], bool]
+
+
+def je_interaktivni() -> bool:
+    """
+    Vrátí True, pokud výstup i vstup jsou terminál
+    (má smysl stránkovat a ptát se uživatele).
+    """
+    try:
+        return sys.stdout.isatty() and sys.stdin.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def velikost_stranky() -> int:
+    """
+    Vrátí počet řádků na stránku pro aktuální režim výpisu.
+    """
+    if je_interaktivni():
+        vyska = shutil.get_terminal_size().lines
+        return max(1, vyska - REZERVA_RADKU)
+    return VELIKOST_DAVKY
+
+
+def zkrat(text: str, sirka: int, zkracovat: bool = True) -> str:
+    """
+    Zkrátí text na zadanou šířku (zkrácení označí '…')
+    a doplní jej mezerami na přesnou šířku.
+    Pokud zkracovat je False, text pouze doplní mezerami.
+    """
+    text = " ".join(text.split())  # Zalomení řádků by rozbilo sloupce
+    if zkracovat and len(text) > sirka:
+        text = text[:max(0, sirka - 1)] + "…"
+    return text.ljust(sirka)
+
+
+def formatuj_radky(
+    radky: Iterable[dict],
+    sloupce: list[Sloupec],
+    sirka_radku: int | None = None
+) -> str:
+    """
+    Naformátuje řádky do zarovnaných sloupců oddělených mezerou.
+
+    Args:
+        radky (Iterable[dict]): Řádky výpisu.
+        sloupce (list[Sloupec]): Definice sloupců.
+        sirka_radku (int | None): Celková šířka řádku. Poslední sloupec
+            se zkrátí tak, aby se řádek vešel. Pokud je None,
+            nezkracuje se žádný sloupec (rychlý režim bez ztráty dat).
+
+    Returns:
+        str: Naformátované řádky včetně koncových znaků nového řádku.
+    """
+    pevne = sloupce[:-1]
+    posledni = sloupce[-1]
+    zkracovat = sirka_radku is not None
+    sirka_posledniho = None
+    if zkracovat:
+        obsazeno = sum(sirka + 1 for _, _, sirka in pevne)
+        sirka_posledniho = max(MIN_SIRKA_POSLEDNIHO, sirka_radku - obsazeno)
+
+    casti = []
+    for radek in radky:
+        bunky = [
+            zkrat(str(hodnota(radek)), sirka, zkracovat)
+            for _, hodnota, sirka in pevne
+        ]
+        text_posledniho = " ".join(str(posledni[1](radek)).split())
+        if zkracovat:
+            text_posledniho = zkrat(text_posledniho, sirka_posledniho).rstrip()
+        bunky.append(text_posledniho)
+        casti.append(" ".join(bunky))
+        casti.append("\n")
+    return "".join(casti)
+
+
+def formatuj_zahlavi(sloupce: list[Sloupec]) -> str:
+    """
+    Vrátí zarovnané záhlaví sloupců.
+    """
+    bunky = [zkrat(nazev, sirka) for nazev, _, sirka in sloupce[:-1]]
+    bunky.append(sloupce[-1][0])
+    return " ".join(bunky) + "\n"
+
+
+def vypis_po_strankach(
+    stranky: Iterable[Stranka],
+    sloupce: list[Sloupec],
+    vstup: Callable[[str], str] = input
+) -> int:
+    """
+    Vypíše řádky po stránkách se zarovnanými sloupci.
+
+    V interaktivním režimu se po každé stránce kromě poslední zeptá,
+    zda pokračovat.
+    Další stránka se ze zdroje vyžádá až po potvrzení, takže
+    po ukončení se už nic dalšího nenačítá. V rychlém režimu vypíše
+    vše bez dotazů a výstup vyprázdní až na konci.
+    Pokud čtenář roury skončí dřív, ukončí program s kódem 1.
+
+    Args:
+        stranky (Iterable[Stranka]): Zdroj stránek s příznakem poslední
+            stránky (např. generátor, který každou stránku načte
+            z databáze). Po poslední stránce se uživatele na nic neptá.
+        sloupce (list[Sloupec]): Definice sloupců.
+        vstup (Callable[[str], str]): Funkce pro dotaz na uživatele.
+
+    Returns:
+        int: Počet vypsaných řádků.
+    """
+    interaktivni = je_interaktivni()
+    sirka_radku = shutil.get_terminal_size().columns if interaktivni else None
+    vystup = sys.stdout
+
+    vypsano = 0
+    try:
+        vystup.write(formatuj_zahlavi(sloupce))
+        for stranka, posledni in stranky:
+            vystup.write(formatuj_radky(stranka, sloupce, sirka_radku))
+            vypsano += len(stranka)
+            if interaktivni and not posledni:
+                vystup.flush()
+                volba = vstup("-- Enter = další stránka, q = konec -- ")
+                if volba.strip().lower() == "q":
+                    break
+        vystup.flush()
+    except BrokenPipeError:
+        # Čtenář roury skončil (např. head), výstup už nikdo nečte
+        _zahod_dalsi_vystup()
+        sys.exit(1)
+    return vypsano
+
+
+def _zahod_dalsi_vystup():
+    """
+    Přesměruje standardní výstup do /dev/null, aby vyprázdnění
+    bufferu při ukončení programu neskončilo další chybou.
+    """
+    try:
+        prazdny = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(prazdny, sys.stdout.fileno())
+        os.close(prazdny)
+    except (OSError, ValueError, AttributeError):
+        pass
+
+
+def stranky_seznamu(
+    radky: list[dict], velikost: int | None = None
+) -> Iterable[Stranka]:
+    """
+    Rozdělí již načtený seznam řádků na stránky.
+    """
+    velikost = velikost or velikost_stranky()
+    for od in range(0, len(radky), velikost):
+        yield radky[od:od + velikost], od + velikost >= len(radky)
@@ -0,0 +1,303 @@
+"""
+Závislosti mezi úkoly.
+Úkol může záviset na jiných úkolech (předchůdcích). Úkol je připraven
+ke zpracování, pokud je ve stavu 'Nezahájeno' a všichni jeho předchůdci
+jsou ve stavu 'Hotovo'.
+
+Připravenost se neodvozuje procházením celého grafu. Každý úkol má
+ve sloupci 'pocet_nesplnenych' počet předchůdců, kteří ještě nejsou
+hotoví. Počítadlo se upravuje při propojení a odpojení úkolů, při změně
+stavu a při odstranění úkolu, vždy jen u přímých následníků měněného
+úkolu. Výpis připravených úkolů pak čte index idx_pripravene.
+
+Přidávání závislostí je serializované pojmenovaným zámkem databáze,
+aby dvě souběžná propojení nemohla společně vytvořit cyklus.
+"""
+import mysql.connector
+
+from . import config
+from .smerovac import spojeni_pro_cteni, spojeni_pro_zapis
+
+# Jak dlouho (v sekundách) čekat na zámek pro přidání závislosti
+CEKANI_NA_ZAMEK_S = 10
+# Nejvyšší počet úrovní rekurze při hledání cyklu (výchozí limit MySQL
+# cte_max_recursion_depth je 1000, delší řetězce závislostí by selhaly)
+MAX_HLOUBKA_ZAVISLOSTI = 10_000_000
+
+
+def vytvor_tabulku_zavislosti(cursor):
+    """
+    Vytvoří tabulku závislostí pomocí předaného kurzoru, pokud neexistuje.
+    Řádek (ukol_id, predchozi_id) znamená, že úkol ukol_id čeká
+    na dokončení úkolu predchozi_id. Při odstranění úkolu se jeho
+    závislosti odstraní automaticky (ON DELETE CASCADE).
+    """
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {config.TABLE_DEPENDENCIES} (
+            ukol_id INT NOT NULL,
+            predchozi_id INT NOT NULL,
+            PRIMARY KEY (ukol_id, predchozi_id),
+            INDEX idx_predchozi (predchozi_id),
+            FOREIGN KEY (ukol_id)
+                REFERENCES {config.TABLE_TASKS} (id) ON DELETE CASCADE,
+            FOREIGN KEY (predchozi_id)
+                REFERENCES {config.TABLE_TASKS} (id) ON DELETE CASCADE
+        )
+    """)
+
+
+def vytvoril_by_cyklus(cursor, ukol_id: int, predchozi_id: int) -> bool:
+    """
+    Ověří, zda by závislost ukol_id -> predchozi_id vytvořila cyklus,
+    tj. zda predchozi_id (i nepřímo) již nezávisí na ukol_id.
+    Prochází pouze předchůdce úkolu predchozi_id.
+    """
+    if ukol_id == predchozi_id:
+        return True
+    cursor.execute(
+        "SET SESSION cte_max_recursion_depth = %s", (MAX_HLOUBKA_ZAVISLOSTI,)
+    )
+    cursor.execute(f"""
+        WITH RECURSIVE predchudci (id) AS (
+            SELECT predchozi_id FROM {config.TABLE_DEPENDENCIES}
+            WHERE ukol_id = %s
+            UNION
+            SELECT z.predchozi_id
+            FROM {config.TABLE_DEPENDENCIES} z
+            JOIN predchudci p ON z.ukol_id = p.id
+        )
+        SELECT 1 FROM predchudci WHERE id = %s LIMIT 1
+    """, (predchozi_id, ukol_id))
+    return cursor.fetchone() is not None
+
+
+def _uprav_pocitadlo_naslednych(cursor, predchozi_id: int, zmena: int):
+    """
+    Přičte změnu k počítadlu nesplněných předchůdců všech úkolů,
+    které přímo závisí na úkolu predchozi_id.
+    """
+    cursor.execute(f"""
+        UPDATE {config.TABLE_TASKS} u
+        JOIN {config.TABLE_DEPENDENCIES} z ON z.ukol_id = u.id
+        SET u.pocet_nesplnenych = u.pocet_nesplnenych + %s
+        WHERE z.predchozi_id = %s
+    """, (zmena, predchozi_id))
+
+
+def pri_zmene_stavu(cursor, ukol_id: int, stary_stav: str, novy_stav: str):
+    """
+    Upraví počítadla následníků úkolu po změně jeho stavu.
+    Volá se v rámci transakce, která stav mění.
+    """
+    if stary_stav != config.STAV_HOTOVO and novy_stav == config.STAV_HOTOVO:
+        _uprav_pocitadlo_naslednych(cursor, ukol_id, -1)
+    elif stary_stav == config.STAV_HOTOVO and novy_stav != config.STAV_HOTOVO:
+        _uprav_pocitadlo_naslednych(cursor, ukol_id, 1)
+
+
+def pred_odstranenim(cursor, ukol_id: int, stav: str):
+    """
+    Upraví počítadla následníků úkolu, který se bude odstraňovat.
+    Nehotový úkol přestane blokovat své následníky. Samotné závislosti
+    odstraní databáze spolu s úkolem (ON DELETE CASCADE).
+    """
+    if stav != config.STAV_HOTOVO:
+        _uprav_pocitadlo_naslednych(cursor, ukol_id, -1)
+
+
+def propojit_ukoly(db_conn, ukol_id: int, predchozi_id: int) -> bool:
+    """
+    Přidá závislost: úkol ukol_id čeká na dokončení úkolu predchozi_id.
+
+    Args:
+        db_conn: Připojení k databázi.
+        ukol_id (int): ID úkolu, který závisí.
+        predchozi_id (int): ID úkolu, na kterém závisí.
+
+    Vrací True, pokud byla závislost přidána, jinak False
+    (neexistující úkol, již existující závislost nebo cyklus).
+    Při chybě se provede pokus o rollback a vypíše chybová hláška.
+
+    Kontrola cyklu a vložení závislosti probíhají pod pojmenovaným
+    zámkem. Bez něj by dvě souběžná propojení A -> B a B -> A prošla
+    kontrolou současně (každé vidí graf bez druhé závislosti).
+    """
+    if not db_conn or not db_conn.is_connected():
+        print("Nepodařilo se připojit k databázi.")
+        return False
+
+    db_conn = spojeni_pro_zapis(db_conn)
+    cursor = None
+    zamceno = False
+    nazev_zamku = f".{config.TABLE_DEPENDENCIES}"
+    try:
+        cursor = db_conn.cursor()
+        # Ukončení případné starší transakce, aby kontrola cyklu četla
+        # aktuální graf, a ne snímek z dřívějšího čtení
+        db_conn.commit()
+        cursor.execute(
+            "SELECT GET_LOCK(CONCAT(DATABASE(), %s), %s)",
+            (nazev_zamku, CEKANI_NA_ZAMEK_S)
+        )
+        zamceno = cursor.fetchone()[0] == 1
+        if not zamceno:
+            print("Závislosti právě upravuje někdo jiný, zkuste to znovu.")
+            return False
+
+        # Zamčení obou úkolů, aby se souběžně nezměnil jejich stav
+        cursor.execute(
+            f"SELECT id, stav FROM {config.TABLE_TASKS} "
+            "WHERE id IN (%s, %s) FOR UPDATE",
+            (ukol_id, predchozi_id)
+        )
+        stavy = dict(cursor.fetchall())
+        if ukol_id not in stavy or predchozi_id not in stavy:
+            db_conn.rollback()
+            print("Úkol pro vytvoření závislosti nebyl nalezen.")
+            return False
+
+        if vytvoril_by_cyklus(cursor, ukol_id, predchozi_id):
+            db_conn.rollback()
+            print(
+                f"Závislost úkolu {ukol_id} na úkolu {predchozi_id} "
+                "by vytvořila cyklus."
+            )
+            return False
+
+        cursor.execute(
+            f"INSERT IGNORE INTO {config.TABLE_DEPENDENCIES} "
+            "(ukol_id, predchozi_id) VALUES (%s, %s)",
+            (ukol_id, predchozi_id)
+        )
+        if cursor.rowcount == 0:
+            db_conn.rollback()
+            print(
+                f"Úkol {ukol_id} již na úkolu {predchozi_id} závisí."
+            )
+            return False
+
+        if stavy[predchozi_id] != config.STAV_HOTOVO:
+            cursor.execute(
+                f"UPDATE {config.TABLE_TASKS} "
+                "SET pocet_nesplnenych = pocet_nesplnenych + 1 WHERE id = %s",
+                (ukol_id,)
+            )
+        db_conn.commit()
+        print(f"Úkol {ukol_id} nyní závisí na úkolu {predchozi_id}.")
+        return True
+
+    except mysql.connector.Error as err:
+        if db_conn:
+            db_conn.rollback()
+        print(f"Chyba při přidávání závislosti: {err}")
+        return False
+    finally:
+        if cursor:
+            if zamceno:
+                try:
+                    cursor.execute(
+                        "SELECT RELEASE_LOCK(CONCAT(DATABASE(), %s))",
+                        (nazev_zamku,)
+                    )
+                    cursor.fetchone()
+                except mysql.connector.Error as err:
+                    print(f"Chyba při uvolnění zámku závislostí: {err}")
+            cursor.close()
+
+
+def odpojit_ukoly(db_conn, ukol_id: int, predchozi_id: int) -> bool:
+    """
+    Odstraní závislost úkolu ukol_id na úkolu predchozi_id.
+
+    Args:
+        db_conn: Připojení k databázi.
+        ukol_id (int): ID úkolu, který závisí.
+        predchozi_id (int): ID úkolu, na kterém závisí.
+
+    Vrací True, pokud byla závislost odstraněna, jinak False.
+    """
+    if not db_conn or not db_conn.is_connected():
+        print("Nepodařilo se připojit k databázi.")
+        return False
+
+    db_conn = spojeni_pro_zapis(db_conn)
+    cursor = None
+    try:
+        cursor = db_conn.cursor()
+        cursor.execute(
+            f"SELECT stav FROM {config.TABLE_TASKS} WHERE id = %s FOR UPDATE",
+            (predchozi_id,)
+        )
+        predchozi = cursor.fetchone()
+        cursor.execute(
+            f"DELETE FROM {config.TABLE_DEPENDENCIES} "
+            "WHERE ukol_id = %s AND predchozi_id = %s",
+            (ukol_id, predchozi_id)
+        )
+        if cursor.rowcount == 0:
+            db_conn.rollback()
+            print(
+                f"Závislost úkolu {ukol_id} na úkolu {predchozi_id} "
+                "nebyla nalezena."
+            )
+            return False
+
+        if predchozi and predchozi[0] != config.STAV_HOTOVO:
+            cursor.execute(
+                f"UPDATE {config.TABLE_TASKS} "
+                "SET pocet_nesplnenych = pocet_nesplnenych - 1 WHERE id = %s",
+                (ukol_id,)
+            )
+        db_conn.commit()
+        print(
+            f"Závislost úkolu {ukol_id} na úkolu {predchozi_id} "
+            "byla odstraněna."
+        )
+        return True
+
+    except mysql.connector.Error as err:
+        if db_conn:
+            db_conn.rollback()
+        print(f"Chyba při odstraňování závislosti: {err}")
+        return False
+    finally:
+        if cursor:
+            cursor.close()
+
+
+def pripravene_ukoly(db_conn, pocet: int | None = None) -> list[dict]:
+    """
+    Vrátí úkoly ve stavu 'Nezahájeno', jejichž předchůdci jsou hotoví
+    (nebo které nemají žádné předchůdce), seřazené podle ID.
+    V případě chyby při načítání úkolů vrátí prázdný seznam.
+
+    Args:
+        db_conn: Připojení k databázi.
+        pocet (int | None, optional): Maximální počet vrácených úkolů.
+            Pokud je None, vrátí všechny připravené úkoly.
+    """
+    if not db_conn or not db_conn.is_connected():
+        print("Nepodařilo se připojit k databázi.")
+        return []
+
+    db_conn = spojeni_pro_cteni(db_conn)
+    cursor = None
+    try:
+        cursor = db_conn.cursor(dictionary=True)
+        dotaz = (
+            f"SELECT id, název, popis, stav, priorita, termin "
+            f"FROM {config.TABLE_TASKS} "
+            "WHERE stav = %s AND pocet_nesplnenych = 0 ORDER BY id"
+        )
+        parametry = [config.STAV_NEZAHAJENO]
+        if pocet is not None:
+            dotaz += " LIMIT %s"
+            parametry.append(pocet)
+        cursor.execute(dotaz, parametry)
+        return cursor.fetchall()
+    except mysql.connector.Error as err:
+        print(f"Chyba při načítání připravených úkolů: {err}")
+        return []
+    finally:
+        if cursor:
+            cursor.close()
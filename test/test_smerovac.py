@@ -0,0 +1,269 @@
+"""
+Testy směrování dotazů z modulu smerovac.py pomocí frameworku pytest.
+Místo skutečných serverů MySQL používají jednoduchou náhradu připojení,
+takže nevyžadují spuštěnou databázi.
+"""
+import mysql.connector
+
+from src.smerovac import (
+    SmerovacSpojeni, rozloz_adresu, spojeni_pro_cteni, spojeni_pro_zapis
+)
+
+
+class NahradniSpojeni:
+    """
+    Náhrada připojení k MySQL, která eviduje svou dostupnost a vrací
+    řádky ze sdíleného seznamu 'data'. Pozice 'gtid' je počet provedených
+    transakcí (None = server nepoužívá GTID). Bez autocommitu napodobuje
+    REPEATABLE READ: první čtení otevře transakci a další čtení vidí
+    stejný snímek až do commit() nebo rollback().
+    """
+
+    def __init__(
+        self, nazev: str, dostupne: bool = True, data: list | None = None,
+        autocommit: bool = True, gtid: int | None = None
+    ):
+        self.nazev = nazev
+        self.dostupne = dostupne
+        self.uzavreno = False
+        self.data = data if data is not None else []
+        self.autocommit = autocommit
+        self.gtid = gtid
+        self._snimek = None
+
+    def cursor(self, dictionary: bool = False):
+        return NahradniKurzor(self)
+
+    def cti(self) -> list:
+        if self.autocommit:
+            return list(self.data)
+        if self._snimek is None:
+            self._snimek = list(self.data)
+        return self._snimek
+
+    def commit(self):
+        self._snimek = None
+
+    def rollback(self):
+        self._snimek = None
+
+    def is_connected(self) -> bool:
+        return self.dostupne and not self.uzavreno
+
+    def reconnect(self, attempts: int = 1, delay: int = 0):
+        if not self.dostupne:
+            raise mysql.connector.InterfaceError("Server je nedostupný.")
+
+    def close(self):
+        self.uzavreno = True
+
+
+class NahradniKurzor:
+    """
+    Kurzor náhradního připojení. Rozumí dotazům na GTID, ostatní
+    dotazy vrací data připojení.
+    """
+
+    def __init__(self, spojeni: NahradniSpojeni):
+        self.spojeni = spojeni
+        self._vysledek = []
+
+    def execute(self, dotaz: str, parametry=None):
+        gtid = self.spojeni.gtid
+        if "GTID_SUBSET" in dotaz:
+            pozadovano = int(parametry[0].rsplit("-", 1)[1])
+            self._vysledek = [(int(pozadovano <= (gtid or 0)),)]
+        elif "gtid_executed" in dotaz:
+            self._vysledek = [(f"primar:1-{gtid}" if gtid else "",)]
+        else:
+            self._vysledek = self.spojeni.cti()
+
+    def fetchone(self):
+        return self._vysledek[0] if self._vysledek else None
+
+    def fetchall(self) -> list:
+        return self._vysledek
+
+    def close(self):
+        pass
+
+
+def precti(smerovac) -> list:
+    """Provede čtení přes směrovač stejně jako funkce v main.py."""
+    cursor = spojeni_pro_cteni(smerovac).cursor()
+    cursor.execute("SELECT * FROM ukoly")
+    radky = cursor.fetchall()
+    cursor.close()
+    return radky
+
+
+class Hodiny:
+    """Ručně posouvaný čas pro testy."""
+
+    def __init__(self):
+        self.cas = 0.0
+
+    def __call__(self) -> float:
+        return self.cas
+
+
+def test_rozloz_adresu():
+    """
+    Testuje rozložení adresy repliky na host a port.
+    """
+    assert rozloz_adresu("localhost:3307") == ("localhost", 3307)
+    assert rozloz_adresu("db-replika") == ("db-replika", 3306)
+
+
+def test_cteni_round_robin():
+    """
+    Testuje, že se čtení střídavě rozkládá na všechny repliky
+    a zápis jde vždy na primár.
+    """
+    primar = NahradniSpojeni("primar")
+    r1, r2 = NahradniSpojeni("r1"), NahradniSpojeni("r2")
+    smerovac = SmerovacSpojeni(primar, [r1, r2], hodiny=Hodiny())
+
+    vybrane = [spojeni_pro_cteni(smerovac).nazev for _ in range(4)]
+    assert vybrane == ["r1", "r2", "r1", "r2"], (
+        "Čtení se nerozkládá na repliky metodou round-robin."
+    )
+
+
+def test_read_your_writes():
+    """
+    Testuje, že relace bez GTID po zápisu čte z primáru a po uplynutí
+    okna se vrací ke čtení z replik.
+    """
+    hodiny = Hodiny()
+    primar = NahradniSpojeni("primar")
+    smerovac = SmerovacSpojeni(
+        primar, [NahradniSpojeni("r1")], okno_po_zapisu=5, hodiny=hodiny
+    )
+
+    assert spojeni_pro_zapis(smerovac) is primar
+    hodiny.cas = 4.0
+    assert spojeni_pro_cteni(smerovac) is primar, (
+        "Čtení krátce po zápisu nešlo na primár."
+    )
+    hodiny.cas = 6.0
+    assert spojeni_pro_cteni(smerovac).nazev == "r1", (
+        "Po uplynutí okna se čtení nevrátilo na repliku."
+    )
+
+
+def test_read_your_writes_gtid():
+    """
+    Testuje, že po zápisu relace čte jen z replik, které již provedly
+    její zápis, a pokud žádná taková není, čte z primáru.
+    """
+    hodiny = Hodiny()
+    primar = NahradniSpojeni("primar", gtid=4)
+    r1, r2 = NahradniSpojeni("r1", gtid=4), NahradniSpojeni("r2", gtid=4)
+    smerovac = SmerovacSpojeni(primar, [r1, r2], hodiny=hodiny)
+
+    spojeni_pro_zapis(smerovac)
+    primar.gtid = 5
+    assert spojeni_pro_cteni(smerovac) is primar, (
+        "Čtení po zápisu šlo na repliku, která zápis ještě neprovedla."
+    )
+
+    r2.gtid = 5
+    assert [spojeni_pro_cteni(smerovac) for _ in range(2)] == [r2, r2], (
+        "Čtení šlo na zpožděnou repliku."
+    )
+
+    # Bez čekání na časové okno se používají všechny dohnané repliky
+    r1.gtid = 5
+    vybrane = [spojeni_pro_cteni(smerovac).nazev for _ in range(2)]
+    assert sorted(vybrane) == ["r1", "r2"]
+    assert hodiny.cas == 0.0
+
+
+def test_cteni_z_repliky_vidi_nova_data():
+    """
+    Testuje, že opakovaná čtení z repliky nevidí stále stejný snímek
+    dat – směrovač repliky přepne do režimu autocommit.
+    """
+    hodiny = Hodiny()
+    data = ["Úkol 1"]
+    replika = NahradniSpojeni("r1", data=data, autocommit=False)
+    smerovac = SmerovacSpojeni(
+        NahradniSpojeni("primar"), [replika], okno_po_zapisu=5, hodiny=hodiny
+    )
+
+    assert precti(smerovac) == ["Úkol 1"]
+    spojeni_pro_zapis(smerovac)
+    data.append("Úkol 2")  # Zápis se replikoval na repliku
+    hodiny.cas = 6.0
+    assert precti(smerovac) == ["Úkol 1", "Úkol 2"], (
+        "Čtení z repliky vidí starý snímek dat."
+    )
+
+
+def test_nedostupna_replika():
+    """
+    Testuje přeskočení nedostupné repliky a návrat na primár,
+    pokud nejsou dostupné žádné repliky.
+    """
+    hodiny = Hodiny()
+    primar = NahradniSpojeni("primar")
+    r1, r2 = NahradniSpojeni("r1", dostupne=False), NahradniSpojeni("r2")
+    smerovac = SmerovacSpojeni(
+        primar, [r1, r2], pauza_repliky=30, hodiny=hodiny
+    )
+
+    assert spojeni_pro_cteni(smerovac) is r2
+    assert spojeni_pro_cteni(smerovac) is r2
+
+    r2.dostupne = False
+    assert spojeni_pro_cteni(smerovac) is primar, (
+        "Při výpadku všech replik se čtení nevrátilo na primár."
+    )
+
+    # Po uplynutí pauzy se obnovená replika znovu používá
+    r1.dostupne = True
+    hodiny.cas = 31.0
+    assert spojeni_pro_cteni(smerovac) is r1
+
+
+def test_pozdni_pripojeni_repliky():
+    """
+    Testuje, že se k replice nedostupné při spuštění směrovač připojí
+    po uplynutí pauzy, jakmile je replika opět v provozu.
+    """
+    hodiny = Hodiny()
+    primar = NahradniSpojeni("primar")
+    replika = NahradniSpojeni("r1")
+    server_bezi = False
+    pokusy = []
+
+    def pripojit(index):
+        pokusy.append(index)
+        return replika if server_bezi else None
+
+    smerovac = SmerovacSpojeni(
+        primar, [None], pripojit_repliku=pripojit, pauza_repliky=30,
+        hodiny=hodiny
+    )
+    assert spojeni_pro_cteni(smerovac) is primar
+    hodiny.cas = 10.0
+    assert spojeni_pro_cteni(smerovac) is primar
+    assert pokusy == [0], "Během pauzy se směrovač znovu připojoval."
+
+    server_bezi = True
+    hodiny.cas = 31.0
+    assert spojeni_pro_cteni(smerovac) is replika, (
+        "Směrovač se k obnovené replice znovu nepřipojil."
+    )
+    assert spojeni_pro_cteni(smerovac) is replika
+    assert pokusy == [0, 0]
+
+
+def test_obycejne_spojeni_beze_zmeny():
+    """
+    Testuje, že obyčejné připojení projde směrováním beze změny.
+    """
+    spojeni = NahradniSpojeni("primar")
+    assert spojeni_pro_cteni(spojeni) is spojeni
+    assert spojeni_pro_zapis(spojeni) is spojeni
@@ -0,0 +1,31 @@
+"""
+Testy sestavení filtrů štítků z modulu stitky.py.
+Nevyžadují spuštěný MySQL server.
+"""
+from src.stitky import podminka_stitku, rozloz_stitky
+
+
+def test_rozloz_stitky():
+    """
+    Testuje rozložení štítků zadaných uživatelem.
+    """
+    assert rozloz_stitky(" tym-a, sprint-3,,tym-a ") == ["tym-a", "sprint-3"]
+    assert rozloz_stitky("") == []
+
+
+def test_podminka_stitku():
+    """
+    Testuje sestavení podmínky pro kombinaci filtrů AND/OR/NOT.
+    Očekává, že počet štítků v podmínce AND určí databáze
+    (podle collation názvů), ne počet zadaných řetězců.
+    """
+    assert podminka_stitku() == ("", [])
+
+    podminka, parametry = podminka_stitku(
+        stitky_vse=["a", "b", "a"], stitky_nektery=["c"], stitky_bez=["d"]
+    )
+    assert "HAVING COUNT(DISTINCT us.stitek_id) = (SELECT COUNT(*)" in podminka
+    assert podminka.count("EXISTS") == 2
+    assert "id NOT IN" in podminka
+    assert podminka.count("%s") == len(parametry)
+    assert parametry == ["a", "b", "a", "b", "a", "b", "c", "d"]
@@ -4,19 +4,29 @@ Testují pozitivní a negativní scénáře pro přidání, aktualizaci
 a odstranění úkolů.
 Používají testovací databázi MySQL.
 """
+from datetime import date
+
 import mysql.connector
 import pytest
 
 import src.config as config
-from src.main import aktualizovat_ukol, odstranit_ukol, pridat_ukol
+from src.main import (
+    aktualizovat_ukol, dalsi_ukoly, filtrovat_ukoly, odstranit_ukol,
+    pridat_ukol, vytvor_tabulku_ukolu
+)
+from src.stitky import odznacit_ukoly, oznacit_ukoly, vytvor_tabulky_stitku
+from src.zavislosti import (
+    odpojit_ukoly, pripravene_ukoly, propojit_ukoly, vytvor_tabulku_zavislosti
+)
 
 
 @pytest.fixture(scope="function")
 def db_conn():
     """
     Pytest fixture pro vytvoření připojení k testovací databázi
-    a nastavení testovací tabulky 'ukoly' v databázi 'task_manager_test'.
-    Tabulka se po dokončení testů odstraní.
+    a nastavení testovacích tabulek 'ukoly', 'zavislosti', 'stitky'
+    a 'ukoly_stitky' v databázi 'task_manager_test'.
+    Tabulky se po dokončení testů odstraní.
     """
     db_conn_data = {
         "host": config.DB_HOST, # Můžeme použít stejné jako pro app
@@ -32,21 +42,18 @@ def db_conn():
             f"CREATE DATABASE IF NOT EXISTS {config.TEST_DB_NAME}"
         )
         setup_cursor.execute(f"USE {config.TEST_DB_NAME}") # Výběr databáze
-        setup_cursor.execute(f"DROP TABLE IF EXISTS {config.TEST_TABLE_TASKS}")
-        # Použití konstant pro stavy v ENUM definici
-        status_enum_values = (
-            f"'{config.STAV_NEZAHAJENO}', '{config.STAV_HOTOVO}', "
-            f"'{config.STAV_PROBIHA}'"
+        setup_cursor.execute(
+            f"DROP TABLE IF EXISTS {config.TEST_TABLE_TASK_TAGS}"
         )
-        setup_cursor.execute(f"""
-            CREATE TABLE {config.TEST_TABLE_TASKS} (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                název VARCHAR(50) NOT NULL UNIQUE,
-                popis TEXT NOT NULL,
-                stav ENUM({status_enum_values}),
-                datum_vytvoření TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        setup_cursor.execute(f"DROP TABLE IF EXISTS {config.TEST_TABLE_TAGS}")
+        setup_cursor.execute(
+            f"DROP TABLE IF EXISTS {config.TEST_TABLE_DEPENDENCIES}"
+        )
+        setup_cursor.execute(f"DROP TABLE IF EXISTS {config.TEST_TABLE_TASKS}")
+        # Stejné definice tabulek jako v aplikaci (včetně indexů)
+        vytvor_tabulku_ukolu(setup_cursor)
+        vytvor_tabulku_zavislosti(setup_cursor)
+        vytvor_tabulky_stitku(setup_cursor)
         conn.commit()
         setup_cursor.close()
 
@@ -62,6 +69,15 @@ def db_conn():
             cleanup_cursor = conn.cursor() # Nový kurzor pro úklid
             try:
                 cleanup_cursor.execute(f"USE {config.TEST_DB_NAME}")
+                cleanup_cursor.execute(
+                    f"DROP TABLE IF EXISTS {config.TEST_TABLE_TASK_TAGS}"
+                )
+                cleanup_cursor.execute(
+                    f"DROP TABLE IF EXISTS {config.TEST_TABLE_TAGS}"
+                )
+                cleanup_cursor.execute(
+                    f"DROP TABLE IF EXISTS {config.TEST_TABLE_DEPENDENCIES}"
+                )
                 cleanup_cursor.execute(
                     f"DROP TABLE IF EXISTS {config.TEST_TABLE_TASKS}"
                 )
@@ -224,3 +240,282 @@ def test_odstranit_negative(db_conn):
     assert not uspech_odstraneni, (
         "Funkce odstranit_ukol vrátila úspěch pro neexistující ID."
     )
+
+
+def test_dalsi_ukoly_poradi(db_conn):
+    """
+    Testuje funkci dalsi_ukoly() pro správné pořadí úkolů na řadě.
+    Očekává řazení podle priority, poté podle termínu (bez termínu
+    na konci) a vynechání hotových úkolů.
+    """
+    conn, _ = db_conn
+    id_nizka = pridat_ukol(
+        conn, 'Nízká priorita', 'Popis', config.PRIORITA_NIZKA
+    )
+    id_bez_terminu = pridat_ukol(
+        conn, 'Vysoká bez termínu', 'Popis', config.PRIORITA_VYSOKA
+    )
+    id_pozdejsi = pridat_ukol(
+        conn, 'Vysoká později', 'Popis', config.PRIORITA_VYSOKA,
+        date(2030, 6, 1)
+    )
+    id_drivejsi = pridat_ukol(
+        conn, 'Vysoká dříve', 'Popis', config.PRIORITA_VYSOKA,
+        date(2030, 1, 1)
+    )
+    id_hotovo = pridat_ukol(
+        conn, 'Hotový úkol', 'Popis', config.PRIORITA_VYSOKA,
+        date(2029, 1, 1)
+    )
+    assert aktualizovat_ukol(conn, id_hotovo, config.STAV_HOTOVO)
+
+    poradi = [ukol['id'] for ukol in dalsi_ukoly(conn, 10)]
+    assert poradi == [id_drivejsi, id_pozdejsi, id_bez_terminu, id_nizka], (
+        "Úkoly na řadě nejsou seřazeny podle priority a termínu."
+    )
+    assert [ukol['id'] for ukol in dalsi_ukoly(conn, 2)] == poradi[:2], (
+        "Funkce dalsi_ukoly nerespektuje požadovaný počet úkolů."
+    )
+
+
+def test_aktualizovat_prioritu_a_termin(db_conn):
+    """
+    Testuje funkci aktualizovat_ukol() pro změnu priority a termínu.
+    Očekává uložení nových hodnot a odmítnutí neplatné priority.
+    """
+    conn, cursor = db_conn
+    id_ukolu = pridat_ukol(conn, 'Úkol k přeplánování', 'Popis')
+    assert id_ukolu is not None, "Nepodařilo se přidat úkol pro test."
+
+    novy_termin = date(2031, 3, 15)
+    assert aktualizovat_ukol(
+        conn, id_ukolu, config.STAV_PROBIHA,
+        config.PRIORITA_VYSOKA, novy_termin
+    ), "Funkce aktualizovat_ukol nevrátila úspěch."
+    cursor.execute(
+        f"SELECT priorita, termin FROM {config.TEST_TABLE_TASKS} "
+        f"WHERE id = %s", (id_ukolu,)
+    )
+    assert cursor.fetchone() == (config.PRIORITA_VYSOKA, novy_termin), (
+        "Priorita nebo termín úkolu nebyly správně aktualizovány."
+    )
+
+    assert not aktualizovat_ukol(conn, id_ukolu, config.STAV_HOTOVO, 99), (
+        "Funkce aktualizovat_ukol přijala neplatnou prioritu."
+    )
+
+
+def test_aktualizovat_na_stejny_stav(db_conn):
+    """
+    Testuje funkci aktualizovat_ukol() pro nastavení stavu, který úkol
+    již má. Očekává úspěch, i když UPDATE nezmění žádný řádek.
+    """
+    conn, _ = db_conn
+    id_ukolu = pridat_ukol(conn, 'Úkol beze změny', 'Popis')
+    assert id_ukolu is not None, "Nepodařilo se přidat úkol pro test."
+
+    assert aktualizovat_ukol(conn, id_ukolu, config.STAV_PROBIHA)
+    assert aktualizovat_ukol(conn, id_ukolu, config.STAV_PROBIHA), (
+        "Aktualizace na stejný stav byla vyhodnocena jako nenalezený úkol."
+    )
+
+
+def test_aktualizovat_zruseni_terminu(db_conn):
+    """
+    Testuje funkci aktualizovat_ukol() pro ponechání a zrušení termínu.
+    Očekává, že bez zadání termínu se termín nezmění a None jej zruší.
+    """
+    conn, cursor = db_conn
+    termin = date(2031, 3, 15)
+    id_ukolu = pridat_ukol(conn, 'Úkol s termínem', 'Popis', termin=termin)
+    assert id_ukolu is not None, "Nepodařilo se přidat úkol pro test."
+
+    assert aktualizovat_ukol(conn, id_ukolu, config.STAV_PROBIHA)
+    cursor.execute(
+        f"SELECT termin FROM {config.TEST_TABLE_TASKS} WHERE id = %s",
+        (id_ukolu,)
+    )
+    assert cursor.fetchone() == (termin,), "Termín se bez zadání změnil."
+
+    assert aktualizovat_ukol(conn, id_ukolu, config.STAV_PROBIHA, termin=None)
+    cursor.execute(
+        f"SELECT termin FROM {config.TEST_TABLE_TASKS} WHERE id = %s",
+        (id_ukolu,)
+    )
+    assert cursor.fetchone() == (None,), "Termín úkolu nebyl zrušen."
+
+
+def test_propojit_cyklus(db_conn):
+    """
+    Testuje funkci propojit_ukoly() pro odmítnutí cyklické závislosti.
+    Očekává přijetí závislostí A -> B -> C a odmítnutí C -> A
+    i závislosti úkolu na sobě samém.
+    """
+    conn, _ = db_conn
+    id_a = pridat_ukol(conn, 'Úkol A', 'Popis')
+    id_b = pridat_ukol(conn, 'Úkol B', 'Popis')
+    id_c = pridat_ukol(conn, 'Úkol C', 'Popis')
+
+    assert propojit_ukoly(conn, id_a, id_b), "Závislost A -> B nebyla přidána."
+    assert propojit_ukoly(conn, id_b, id_c), "Závislost B -> C nebyla přidána."
+    assert not propojit_ukoly(conn, id_c, id_a), (
+        "Funkce propojit_ukoly přijala závislost, která tvoří cyklus."
+    )
+    assert not propojit_ukoly(conn, id_a, id_a), (
+        "Funkce propojit_ukoly přijala závislost úkolu na sobě samém."
+    )
+
+
+def test_propojit_dlouhy_retezec(db_conn):
+    """
+    Testuje propojit_ukoly() na řetězci závislostí delším, než je
+    výchozí limit rekurze MySQL (1000 úrovní). Očekává přidání
+    závislosti na začátek řetězce a odmítnutí cyklu přes celý řetězec.
+    """
+    conn, cursor = db_conn
+    delka = 1200
+    cursor.executemany(
+        f"INSERT INTO {config.TEST_TABLE_TASKS} (název, popis, stav) "
+        "VALUES (%s, %s, %s)",
+        [
+            (f"Článek {i}", "Popis", config.STAV_NEZAHAJENO)
+            for i in range(delka)
+        ]
+    )
+    cursor.execute(f"SELECT id FROM {config.TEST_TABLE_TASKS} ORDER BY id")
+    ids = [radek[0] for radek in cursor.fetchall()]
+    # Každý článek řetězce závisí na následujícím
+    cursor.executemany(
+        f"INSERT INTO {config.TEST_TABLE_DEPENDENCIES} "
+        "(ukol_id, predchozi_id) VALUES (%s, %s)",
+        list(zip(ids, ids[1:]))
+    )
+    conn.commit()
+
+    id_novy = pridat_ukol(conn, 'Nový úkol', 'Popis')
+    assert propojit_ukoly(conn, id_novy, ids[0]), (
+        "Závislost na začátku dlouhého řetězce nebyla přidána."
+    )
+    assert not propojit_ukoly(conn, ids[-1], ids[0]), (
+        "Funkce propojit_ukoly přijala cyklus přes dlouhý řetězec."
+    )
+
+
+def test_propojit_cyklus_z_jineho_spojeni(db_conn):
+    """
+    Testuje, že kontrola cyklu vidí závislost přidanou jiným
+    připojením, i když má vlastní připojení otevřený starší snímek dat.
+    """
+    conn, cursor = db_conn
+    id_a = pridat_ukol(conn, 'Úkol A', 'Popis')
+    id_b = pridat_ukol(conn, 'Úkol B', 'Popis')
+    cursor.execute(f"SELECT COUNT(*) FROM {config.TEST_TABLE_DEPENDENCIES}")
+    cursor.fetchone()  # Otevře transakci se snímkem bez závislostí
+
+    druhe_spojeni = mysql.connector.connect(
+        host=config.DB_HOST, user=config.DB_USER,
+        password=config.DB_PASSWORD, database=config.TEST_DB_NAME
+    )
+    try:
+        assert propojit_ukoly(druhe_spojeni, id_a, id_b)
+    finally:
+        druhe_spojeni.close()
+
+    assert not propojit_ukoly(conn, id_b, id_a), (
+        "Kontrola cyklu nevidí závislost přidanou jiným připojením."
+    )
+
+
+def test_pripravene_ukoly_prubezne(db_conn):
+    """
+    Testuje průběžnou údržbu připravených úkolů při změně stavu,
+    odpojení a odstranění předchůdců.
+    """
+    conn, _ = db_conn
+    id_zaklad = pridat_ukol(conn, 'Základ', 'Popis')
+    id_druhy = pridat_ukol(conn, 'Druhý předchůdce', 'Popis')
+    id_cil = pridat_ukol(conn, 'Cílový úkol', 'Popis')
+    assert propojit_ukoly(conn, id_cil, id_zaklad)
+    assert propojit_ukoly(conn, id_cil, id_druhy)
+
+    def pripravena_id():
+        return [ukol['id'] for ukol in pripravene_ukoly(conn)]
+
+    assert id_cil not in pripravena_id(), (
+        "Úkol s nehotovými předchůdci je označen jako připravený."
+    )
+
+    assert aktualizovat_ukol(conn, id_zaklad, config.STAV_HOTOVO)
+    assert odpojit_ukoly(conn, id_cil, id_druhy)
+    assert id_cil in pripravena_id(), (
+        "Úkol se po dokončení a odpojení předchůdců nestal připraveným."
+    )
+
+    assert aktualizovat_ukol(conn, id_zaklad, config.STAV_PROBIHA)
+    assert id_cil not in pripravena_id(), (
+        "Úkol zůstal připravený po znovuotevření předchůdce."
+    )
+
+    assert odstranit_ukol(conn, id_zaklad)
+    assert id_cil in pripravena_id(), (
+        "Úkol se po odstranění nehotového předchůdce nestal připraveným."
+    )
+
+
+def test_oznacit_ukoly_hromadne(db_conn):
+    """
+    Testuje funkce oznacit_ukoly() a odznacit_ukoly() pro hromadné
+    přiřazení a odebrání štítku.
+    Očekává přeskočení neexistujících ID a již existujících přiřazení.
+    """
+    conn, _ = db_conn
+    ids = [
+        pridat_ukol(conn, f'Úkol se štítkem {i}', 'Popis') for i in range(5)
+    ]
+
+    assert oznacit_ukoly(conn, 'tym-backend', ids[:3] + [99999]) == 3, (
+        "Štítek nebyl přiřazen správnému počtu úkolů."
+    )
+    assert oznacit_ukoly(conn, 'tym-backend', ids) == 2, (
+        "Opakované přiřazení štítku nebylo přeskočeno."
+    )
+    assert odznacit_ukoly(conn, 'tym-backend', ids[:2]) == 2, (
+        "Štítek nebyl odebrán správnému počtu úkolů."
+    )
+    oznacene = filtrovat_ukoly(conn, stitky_vse=['tym-backend'])
+    assert [ukol['id'] for ukol in oznacene] == ids[2:], (
+        "Výpis podle štítku neodpovídá provedeným změnám."
+    )
+
+
+def test_filtrovat_ukoly_stitky(db_conn):
+    """
+    Testuje funkci filtrovat_ukoly() pro kombinaci filtrů štítků
+    (AND/OR/NOT) s filtrem stavu.
+    """
+    conn, _ = db_conn
+    id_a = pridat_ukol(conn, 'Backend sprint 1', 'Popis')
+    id_b = pridat_ukol(conn, 'Backend sprint 2', 'Popis')
+    id_c = pridat_ukol(conn, 'Frontend sprint 1', 'Popis')
+    oznacit_ukoly(conn, 'backend', [id_a, id_b])
+    oznacit_ukoly(conn, 'frontend', [id_c])
+    oznacit_ukoly(conn, 'sprint-1', [id_a, id_c])
+    aktualizovat_ukol(conn, id_c, config.STAV_PROBIHA)
+
+    def filtr_id(**filtr):
+        return [ukol['id'] for ukol in filtrovat_ukoly(conn, **filtr)]
+
+    assert filtr_id(stitky_vse=['backend', 'sprint-1']) == [id_a]
+    assert filtr_id(stitky_vse=['Backend', 'backend']) == [id_a, id_b], (
+        "Filtr AND nepovažuje Backend a backend za jeden štítek."
+    )
+    assert filtr_id(stitky_vse=['backend', 'neexistuje']) == []
+    assert filtr_id(stitky_nektery=['backend', 'frontend']) == [
+        id_a, id_b, id_c
+    ]
+    assert filtr_id(stitky_nektery=['sprint-1'], stitky_bez=['backend']) == [
+        id_c
+    ]
+    assert filtr_id(
+        filtr_stavu=config.STAV_NEZAHAJENO, stitky_vse=['sprint-1']
+    ) == [id_a], "Filtr štítků není správně kombinován s filtrem stavu."
@@ -0,0 +1,161 @@
+"""
+Testy stránkovaného výpisu z modulu vystup.py.
+Nevyžadují spuštěný MySQL server.
+"""
+import io
+
+import pytest
+
+import src.vystup as vystup
+from src.main import stranky_ukolu
+from src.vystup import formatuj_radky, stranky_seznamu, vypis_po_strankach
+
+SLOUPCE = [
+    ("ID", lambda radek: radek['id'], 4),
+    ("Název", lambda radek: radek['název'], 8),
+    ("Popis", lambda radek: radek['popis'], None),
+]
+
+
+def test_formatuj_radky_zarovnani_a_zkraceni():
+    """
+    Testuje zarovnání sloupců a zkrácení textu na šířku řádku.
+    """
+    radky = [
+        {"id": 1, "název": "Krátký", "popis": "Popis"},
+        {"id": 22, "název": "Velmi dlouhý název", "popis": "x" * 50},
+    ]
+    text = formatuj_radky(radky, SLOUPCE, sirka_radku=30)
+
+    prvni, druhy = text.splitlines()
+    assert prvni == "1    Krátký   Popis"
+    assert druhy.startswith("22   Velmi d… ")
+    assert len(druhy) == 30 and druhy.endswith("…"), (
+        "Poslední sloupec nebyl zkrácen na šířku řádku."
+    )
+
+
+def test_formatuj_radky_bez_zkraceni():
+    """
+    Testuje rychlý režim, ve kterém se žádný sloupec nezkracuje.
+    """
+    radky = [{"id": 1, "název": "Velmi dlouhý název", "popis": "a\nb"}]
+    assert formatuj_radky(radky, SLOUPCE) == "1    Velmi dlouhý název a b\n"
+
+
+def test_strankovac_ukonceni(monkeypatch, capsys):
+    """
+    Testuje, že po ukončení stránkovače se další stránky nenačítají.
+    """
+    monkeypatch.setattr(vystup, "je_interaktivni", lambda: True)
+    nactene = []
+
+    def stranky():
+        for cislo in range(5):
+            nactene.append(cislo)
+            radky = [{"id": cislo, "název": "Úkol", "popis": "Popis"}]
+            yield radky, cislo == 4
+
+    odpovedi = iter(["", "q"])
+    vypsano = vypis_po_strankach(
+        stranky(), SLOUPCE, vstup=lambda _: next(odpovedi)
+    )
+
+    assert vypsano == 2
+    assert nactene == [0, 1], "Stránkovač načetl stránky po ukončení."
+    assert capsys.readouterr().out.count("Úkol") == 2
+
+
+class NahradniKurzor:
+    """
+    Kurzor nad seznamem úkolů, který rozumí parametrům dotazu
+    ze sestav_dotaz_ukolu() (navazující ID a LIMIT).
+    """
+
+    def __init__(self, ukoly: list[dict]):
+        self.ukoly = ukoly
+        self.dotazy = 0
+        self._vysledek = []
+
+    def execute(self, dotaz: str, parametry: list):
+        self.dotazy += 1
+        od_id = parametry[0] if "id > %s" in dotaz else 0
+        self._vysledek = [
+            ukol for ukol in self.ukoly if ukol["id"] > od_id
+        ][:parametry[-1]]
+
+    def fetchall(self) -> list[dict]:
+        return self._vysledek
+
+
+def test_posledni_plna_stranka(monkeypatch):
+    """
+    Testuje, že po poslední stránce se stránkovač neptá na další
+    ani tehdy, když je stránka plná (počet řádků je násobkem velikosti
+    stránky), a že se nenačítá prázdná stránka navíc.
+    """
+    monkeypatch.setattr(vystup, "je_interaktivni", lambda: True)
+    kurzor = NahradniKurzor(
+        [{"id": i, "název": "Úkol", "popis": "Popis"} for i in range(1, 5)]
+    )
+    dotazy = []
+
+    vypsano = vypis_po_strankach(
+        stranky_ukolu(kurzor, 2), SLOUPCE,
+        vstup=lambda vyzva: dotazy.append(vyzva) or ""
+    )
+    assert vypsano == 4
+    assert len(dotazy) == 1, "Stránkovač se ptal i po poslední stránce."
+    assert kurzor.dotazy == 2, "Načítala se prázdná stránka navíc."
+
+    assert [posledni for _, posledni in stranky_seznamu([{}] * 4, 2)] == [
+        False, True
+    ]
+
+
+def test_rychly_rezim_bez_dotazu(monkeypatch, capsys):
+    """
+    Testuje, že mimo terminál se vypíše vše bez dotazů na uživatele.
+    """
+    monkeypatch.setattr(vystup, "je_interaktivni", lambda: False)
+
+    def vstup(_):
+        raise AssertionError("Rychlý režim se nemá ptát uživatele.")
+
+    stranky = [
+        ([{"id": i, "název": "Úkol", "popis": "Popis"} for i in range(3)],
+         False),
+        ([{"id": 3, "název": "Úkol", "popis": "Popis"}], True),
+    ]
+    assert vypis_po_strankach(stranky, SLOUPCE, vstup=vstup) == 4
+    assert len(capsys.readouterr().out.splitlines()) == 5  # záhlaví + 4
+
+
+class UzavrenaRoura(io.StringIO):
+    """Výstup, jehož čtenář již skončil (např. head)."""
+
+    def write(self, text: str) -> int:
+        raise BrokenPipeError
+
+    def fileno(self) -> int:
+        raise io.UnsupportedOperation("fileno")
+
+
+def test_uzavrena_roura_ukonci_program(monkeypatch):
+    """
+    Testuje, že po uzavření roury se program ukončí a další stránky
+    se nenačítají.
+    """
+    monkeypatch.setattr(vystup, "je_interaktivni", lambda: False)
+    monkeypatch.setattr(vystup.sys, "stdout", UzavrenaRoura())
+    nactene = []
+
+    def stranky():
+        for cislo in range(3):
+            nactene.append(cislo)
+            yield [{"id": cislo, "název": "Úkol", "popis": "Popis"}], False
+
+    with pytest.raises(SystemExit) as ukonceni:
+        vypis_po_strankach(stranky(), SLOUPCE)
+    assert ukonceni.value.code == 1
+    assert nactene == [], "Po uzavření roury se načítaly další stránky."
@@ -0,0 +1,231 @@
+"""
+Testy generátoru zátěže z modulu benchmarks/zatez.py.
+Nevyžadují spuštěný MySQL server.
+"""
+import threading
+
+import mysql.connector
+import pytest
+from mysql.connector import errorcode
+
+import benchmarks.zatez as zatez
+from benchmarks.spolecne import percentil
+from benchmarks.zatez import (
+    VYSLEDEK_CHYBA, VYSLEDEK_KOLIZE, VYSLEDEK_NENALEZENO, VYSLEDEK_OK,
+    rozloz_mix, souhrn, spust_zatez
+)
+from src import config
+from src.main import aktualizovat_ukol, posledni_vysledek, pridat_ukol
+
+
+def test_rozloz_mix():
+    """
+    Testuje rozložení poměru operací a odmítnutí neplatného zadání.
+    """
+    assert rozloz_mix("pridat=3, zobrazit=1") == {
+        "pridat": 3.0, "zobrazit": 1.0
+    }
+    with pytest.raises(ValueError):
+        rozloz_mix("smazat_vse=1")
+    with pytest.raises(ValueError):
+        rozloz_mix("pridat=0")
+
+
+def test_percentil():
+    """
+    Testuje výpočet percentilu metodou nejbližšího pořadí.
+    """
+    hodnoty = [float(i) for i in range(1, 101)]
+    assert percentil(hodnoty, 50) == 50.0
+    assert percentil(hodnoty, 95) == 95.0
+    assert percentil(hodnoty, 99) == 99.0
+    assert percentil([7.0], 99) == 7.0
+    assert percentil([], 50) is None
+
+
+class KolidujiciSpojeni:
+    """
+    Náhrada připojení, u kterého vložení úkolu skončí chybou
+    duplicitního názvu (jako při souběžném přidání stejného úkolu).
+    """
+
+    def is_connected(self) -> bool:
+        return True
+
+    def cursor(self):
+        return self
+
+    def execute(self, dotaz: str, parametry=None):
+        if dotaz.lstrip().startswith("INSERT"):
+            raise mysql.connector.IntegrityError(
+                msg="Duplicate entry", errno=errorcode.ER_DUP_ENTRY
+            )
+
+    def fetchone(self):
+        return None
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_posledni_vysledek():
+    """
+    Testuje, že funkce z main.py rozliší kolizi názvu od ostatních chyb
+    bez ohledu na vytištěnou hlášku.
+    """
+    assert pridat_ukol(KolidujiciSpojeni(), "Úkol", "Popis") is None
+    assert posledni_vysledek() == VYSLEDEK_KOLIZE
+
+    assert pridat_ukol(None, "Úkol", "Popis") is None
+    assert posledni_vysledek() == VYSLEDEK_CHYBA
+
+
+class SpojeniBezZmeny:
+    """
+    Náhrada připojení, u kterého UPDATE nic nezmění (rowcount 0),
+    jako když se úkol aktualizuje na stav, který už má.
+    Parametr stav=None znamená, že úkol neexistuje.
+    """
+
+    def __init__(self, stav: str | None):
+        self.stav = stav
+        self.rowcount = 0
+
+    def is_connected(self) -> bool:
+        return True
+
+    def cursor(self):
+        return self
+
+    def execute(self, dotaz: str, parametry=None):
+        self.rowcount = 0
+
+    def fetchone(self):
+        return (self.stav,) if self.stav else None
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_aktualizace_beze_zmeny_neni_nenalezeno():
+    """
+    Testuje, že aktualizace úkolu na stav, který už má, je úspěch,
+    a nenalezený je jen úkol, který neexistuje.
+    """
+    spojeni = SpojeniBezZmeny(config.STAV_PROBIHA)
+    assert aktualizovat_ukol(spojeni, 1, config.STAV_PROBIHA)
+    assert posledni_vysledek() == VYSLEDEK_OK
+
+    assert not aktualizovat_ukol(
+        SpojeniBezZmeny(None), 1, config.STAV_PROBIHA
+    )
+    assert posledni_vysledek() == VYSLEDEK_NENALEZENO
+
+
+def test_souhrn():
+    """
+    Testuje agregaci záznamů do statistik jednotlivých operací.
+    """
+    zaznamy = [
+        ("pridat", VYSLEDEK_OK, 0.001, 0.0),
+        ("pridat", VYSLEDEK_KOLIZE, 0.003, 0.002),
+        ("zobrazit", VYSLEDEK_OK, 0.002, 0.0),
+    ]
+    statistiky = souhrn(zaznamy, doba=2.0)
+
+    assert statistiky["pridat"]["pocet"] == 2
+    assert statistiky["pridat"]["kolize"] == 1
+    assert statistiky["pridat"]["podil_chyb"] == 0.5
+    assert statistiky["pridat"]["propustnost_s"] == 1.0
+    assert statistiky["pridat"]["p99_ms"] == pytest.approx(3.0)
+    assert statistiky["pridat"]["zpozdeni_p99_ms"] == pytest.approx(2.0)
+    assert statistiky["zobrazit"]["chyba"] == 0
+
+
+class NahradniDatabaze:
+    """
+    Náhrada funkcí z main.py pro běh klientů bez MySQL serveru.
+    Názvy úkolů jsou sdílené všemi klienty, výsledek operace si každé
+    vlákno pamatuje zvlášť (jako posledni_vysledek()).
+    """
+
+    def __init__(self):
+        self.nazvy: dict[str, int] = {}
+        self.zamek = threading.Lock()
+        self.vysledky = threading.local()
+
+    def pripojeni(self, databaze: str):
+        return self
+
+    def is_connected(self) -> bool:
+        return True
+
+    def close(self):
+        pass
+
+    def posledni_vysledek(self) -> str:
+        return self.vysledky.hodnota
+
+    def pridat_ukol(self, db_conn, nazev: str, popis: str):
+        print(f"Hláška klienta: přidávám '{nazev}'.")
+        with self.zamek:
+            if nazev in self.nazvy:
+                self.vysledky.hodnota = VYSLEDEK_KOLIZE
+                return None
+            self.nazvy[nazev] = len(self.nazvy) + 1
+            self.vysledky.hodnota = VYSLEDEK_OK
+            return self.nazvy[nazev]
+
+    def odstranit_ukol(self, db_conn, ukol_id: int) -> bool:
+        print("Hláška klienta: odstraňuji úkol.")
+        self.vysledky.hodnota = VYSLEDEK_OK if ukol_id else VYSLEDEK_NENALEZENO
+        return bool(ukol_id)
+
+
+def test_spust_zatez_vlakna(monkeypatch, capsys):
+    """
+    Testuje běh klientů ve vláknech: hlášky klientů se nevypisují,
+    výstup ostatních vláken ano, kolize sdílených názvů se projeví
+    a záznamy všech klientů se sečtou do souhrnu.
+    """
+    databaze = NahradniDatabaze()
+    monkeypatch.setattr(zatez, "_pripojeni", databaze.pripojeni)
+    monkeypatch.setattr(zatez, "pridat_ukol", databaze.pridat_ukol)
+    monkeypatch.setattr(zatez, "odstranit_ukol", databaze.odstranit_ukol)
+    monkeypatch.setattr(
+        zatez, "posledni_vysledek", databaze.posledni_vysledek
+    )
+    nastaveni = {
+        "klienti": 3, "tempo": 300.0, "doba": 0.3,
+        "mix": {"pridat": 3, "odstranit": 1}, "kolize": 0.5,
+        "procesy": False, "databaze": "zatez_test", "beh": "test",
+    }
+
+    jine_vlakno = threading.Timer(0.1, print, ["Zpráva jiného vlákna."])
+    jine_vlakno.start()
+    vysledek = spust_zatez(nastaveni)
+    jine_vlakno.join()
+
+    vystup = capsys.readouterr().out
+    assert "Hláška klienta" not in vystup, "Výstup klientů nebyl ztlumen."
+    assert "Zpráva jiného vlákna." in vystup, (
+        "Výstup vlákna mimo klienty se ztratil."
+    )
+
+    pridat = vysledek["operace"]["pridat"]
+    odstranit = vysledek["operace"]["odstranit"]
+    assert pridat["kolize"] > 0, "Klienti se nepřetahovali o sdílené názvy."
+    assert pridat["ok"] + pridat["kolize"] == pridat["pocet"]
+    assert pridat["ok"] == len(databaze.nazvy)
+    assert odstranit["ok"] + odstranit["nenalezeno"] == odstranit["pocet"]
+    assert vysledek["cilove_tempo_s"] == 300.0
+    assert 0 < pridat["pocet"] + odstranit["pocet"] <= 300 * 0.3 + 3